@@ -5,11 +5,14 @@ Provides comprehensive structured audit logging using structlog with
 file rotation, compliance formatting, and security event tracking.
 """
 
+import atexit
+import queue
 import structlog
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 import logging
 import logging.handlers
 
@@ -51,6 +54,9 @@ class StructlogAuditLogger(AuditLogger):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.enable_file_rotation = enable_file_rotation
+        self._listener_lock = threading.Lock()
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
         
         # Setup file handlers for different log types
         self._setup_file_handlers()
@@ -116,6 +122,42 @@ class StructlogAuditLogger(AuditLogger):
 
 
 
+    def start_background_writes(self) -> None:
+        """
+        Hand audit file writes to a background thread.
+
+        The audit file handler is moved behind a QueueListener, so logging
+        calls only enqueue the record. Safe to call more than once; stopped
+        automatically at interpreter exit.
+        """
+        with self._listener_lock:
+            if self._listener is not None:
+                return
+            log_queue = queue.SimpleQueue()
+            self._queue_handler = logging.handlers.QueueHandler(log_queue)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, self.audit_handler, respect_handler_level=True
+            )
+            root_logger = logging.getLogger()
+            root_logger.removeHandler(self.audit_handler)
+            root_logger.addHandler(self._queue_handler)
+            self._listener.start()
+        atexit.register(self.stop_background_writes)
+
+    def stop_background_writes(self) -> None:
+        """Flush queued records and write directly to the audit file again."""
+        with self._listener_lock:
+            if self._listener is None:
+                return
+            root_logger = logging.getLogger()
+            root_logger.removeHandler(self._queue_handler)
+            root_logger.addHandler(self.audit_handler)
+            # Drains the queue before the listener thread exits
+            self._listener.stop()
+            self._listener = None
+            self._queue_handler = None
+        atexit.unregister(self.stop_background_writes)
+
     def _log_startup_event(self):
         """Log system startup event."""
         startup_event = AuditEvent(
@@ -193,6 +235,29 @@ class StructlogAuditLogger(AuditLogger):
         )
         self.log(event)
 
+    def log_data_access_batch(self, records: Iterable[Tuple[str, str, str]],
+                              user_id: str = "system", action: str = "ERROR"):
+        """
+        Log many data access events sharing one user and action.
+
+        Records go through the regular handlers, so concurrent callers are
+        never diverted; with start_background_writes() the file writes
+        happen on the listener thread.
+
+        Args:
+            records: (resource_type, resource_id, reason) tuples
+            user_id: User recorded on every event
+            action: Action recorded on every event
+        """
+        for resource_type, resource_id, reason in records:
+            self.log_data_access(
+                user_id=user_id,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                action=action,
+                reason=reason
+            )
+
     def log_configuration_change(self, user_id: str, component: str, 
                                setting_name: str, old_value: str, new_value: str):
         """Log configuration changes for audit trail."""
@@ -9,7 +9,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List
 from ..interfaces.ports import EmailSender
-from ..interfaces.dto import Alert, DeliveryResult
+from ..interfaces.dto import Alert, DeliveryResult, Persona
 from ..interfaces.errors import IntegrationError
 from datetime import datetime
 
@@ -87,7 +87,7 @@ class EmailAdapter(EmailSender):
 
     def _get_recipients(self, alert: Alert) -> List[str]:
         """Get email recipients based on persona."""
-        if alert.persona == "compliance_officer":
+        if alert.persona == Persona.COMPLIANCE_OFFICER:
             return ["compliance@example.com"]
         else:
             return [f"owner-{alert.app_id}@example.com"]
@@ -4,19 +4,136 @@ Slack Adapter for UAM Compliance Intelligence System.
 Sends alerts to Slack using the Slack SDK.
 """
 
+import http.client
+import json as jsonlib
+import threading
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import urlsplit
+
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
 from ..interfaces.ports import SlackSender
 from ..interfaces.dto import Alert, DeliveryResult, Severity
 from ..interfaces.errors import IntegrationError
-from datetime import datetime
+
+
+class _KeepAliveWebClient(WebClient):
+    """
+    WebClient that reuses HTTPS connections across API calls.
+
+    The SDK's urllib transport opens a new TCP+TLS connection for every
+    request; plain JSON POSTs (e.g. chat.postMessage) instead go through a
+    small pool of idle connections shared by all threads. A connection that
+    raised is closed and discarded, never returned to the pool. Other calls
+    (files, form data, proxies) use the SDK transport unchanged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._idle: List[http.client.HTTPSConnection] = []
+        self._pool_lock = threading.Lock()
+        self._closed = False
+
+    def close(self) -> None:
+        """Close idle connections; connections in use close when released."""
+        with self._pool_lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def api_call(
+        self,
+        api_method: str,
+        *,
+        http_verb: str = "POST",
+        files: Optional[dict] = None,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        auth: Optional[dict] = None,
+    ) -> SlackResponse:
+        api_url = f"{self.base_url}{api_method}"
+        parts = urlsplit(api_url)
+        if (
+            json is None or files or data or params or auth or http_verb != "POST"
+            or self.default_params or self.proxy is not None or parts.scheme != "https"
+        ):
+            return super().api_call(
+                api_method, http_verb=http_verb, files=files, data=data,
+                params=params, json=json, headers=headers, auth=auth
+            )
+
+        request_headers = {
+            "Content-Type": "application/json;charset=utf-8",
+            **self.headers,
+            **(headers or {}),
+        }
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        body = jsonlib.dumps(json).encode("utf-8")
+
+        status, resp_headers, raw = self._post(parts.hostname, parts.path, body, request_headers)
+        try:
+            payload = jsonlib.loads(raw.decode("utf-8"))
+        except ValueError:
+            payload = {"ok": False, "error": raw.decode("utf-8", "replace")}
+        return SlackResponse(
+            client=self,
+            http_verb=http_verb,
+            api_url=api_url,
+            req_args={"json": json, "headers": request_headers},
+            data=payload,
+            headers=resp_headers,
+            status_code=status,
+        ).validate()
+
+    def _post(self, host: str, path: str, body: bytes, headers: dict):
+        """POST over a pooled connection; returns (status, headers, body)."""
+        for attempt in range(2):
+            conn, reused = self._acquire(host)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except Exception as e:
+                # Whatever failed, the connection's state is unknown: drop it
+                conn.close()
+                # An idle connection the server already closed: retry once fresh
+                if reused and not attempt and isinstance(e, ConnectionError):
+                    continue
+                raise
+            self._release(conn)
+            return resp.status, dict(resp.headers.items()), raw
+
+    def _acquire(self, host: str):
+        """Take an idle connection to host, or open one; returns (conn, reused)."""
+        with self._pool_lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.host == host:
+                    return conn, True
+                conn.close()
+        return http.client.HTTPSConnection(host, timeout=self.timeout, context=self.ssl), False
+
+    def _release(self, conn: http.client.HTTPSConnection) -> None:
+        """Return a healthy connection to the pool (or close it after close())."""
+        with self._pool_lock:
+            if not self._closed:
+                self._idle.append(conn)
+                return
+        conn.close()
 
 
 class SlackAdapter(SlackSender):
     """
     Slack integration using slack-sdk library.
 
-    Routes alerts to channels based on severity.
+    Routes alerts to channels based on severity. The HTTPS connection to
+    Slack is kept open between sends; call close() on shutdown.
 
     Example:
         slack = SlackAdapter(bot_token="xoxb-...")
@@ -24,7 +141,7 @@ class SlackAdapter(SlackSender):
     """
 
     def __init__(self, bot_token: str):
-        self.client = WebClient(token=bot_token)
+        self.client = _KeepAliveWebClient(token=bot_token)
         self.channel_map = {
             Severity.CRITICAL: "#security-critical",
             Severity.HIGH: "#security-critical",
@@ -62,6 +179,10 @@ class SlackAdapter(SlackSender):
                         }
                     )
 
+    def close(self) -> None:
+        """Close the connections held open to Slack."""
+        self.client.close()
+
     def _format_message(self, alert: Alert) -> str:
         """Format alert as Slack message."""
         severity_emoji = {
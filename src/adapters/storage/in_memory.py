@@ -2,7 +2,7 @@
 In-Memory Storage Adapter for testing.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 from ...interfaces.ports import Storage
 from ...interfaces.dto import KPIRecord, Violation, Alert
 
@@ -30,5 +30,30 @@ class InMemoryStorage(Storage):
     def persist_alert(self, alert: Alert) -> None:
         self.alerts.append(alert)
 
+    def persist_kpis(self, kpis: Iterable[KPIRecord]) -> None:
+        self.kpis.extend(kpis)
+
+    def persist_violations(self, violations: Iterable[Violation]) -> None:
+        self.violations.extend(violations)
+
+    def persist_alerts(self, alerts: Iterable[Alert]) -> None:
+        self.alerts.extend(alerts)
+
     def query_violations(self, app_id: str, state: str) -> List[Violation]:
         return [v for v in self.violations if v.app_id == app_id and v.state == state]
+
+    def extents(self) -> Dict[str, Tuple[int, int]]:
+        return {
+            "kpis": (id(self.kpis), len(self.kpis)),
+            "violations": (id(self.violations), len(self.violations)),
+            "alerts": (id(self.alerts), len(self.alerts)),
+        }
+
+    def load_kpis(self, start: int = 0) -> List[KPIRecord]:
+        return self.kpis[start:]
+
+    def load_violations(self, start: int = 0) -> List[Violation]:
+        return self.violations[start:]
+
+    def load_alerts(self, start: int = 0) -> List[Alert]:
+        return self.alerts[start:]
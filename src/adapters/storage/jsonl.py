@@ -5,8 +5,9 @@ Provides file-based storage using JSON Lines format.
 """
 
 import json
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 from ...interfaces.ports import Storage
 from ...interfaces.dto import KPIRecord, Violation, Alert
 from ...interfaces.errors import StorageError
@@ -99,6 +100,72 @@ class JsonlStorage(Storage):
                 }
             )
 
+    def persist_kpis(self, kpis: Iterable[KPIRecord]) -> None:
+        """
+        Persist a batch of KPI records with a single write.
+
+        Args:
+            kpis: KPIRecord DTOs to persist
+
+        Raises:
+            StorageError: If write fails
+        """
+        payload = "".join(k.model_dump_json() + "\n" for k in kpis)
+        if not payload:
+            return
+        try:
+            with open(self.kpis_file, "a") as f:
+                f.write(payload)
+        except Exception as e:
+            raise StorageError(
+                message=f"Failed to persist KPIs: {str(e)}",
+                context={"file": str(self.kpis_file)}
+            )
+
+    def persist_violations(self, violations: Iterable[Violation]) -> None:
+        """
+        Persist a batch of violation records with a single write.
+
+        Args:
+            violations: Violation DTOs to persist
+
+        Raises:
+            StorageError: If write fails
+        """
+        payload = "".join(v.model_dump_json() + "\n" for v in violations)
+        if not payload:
+            return
+        try:
+            with open(self.violations_file, "a") as f:
+                f.write(payload)
+        except Exception as e:
+            raise StorageError(
+                message=f"Failed to persist violations: {str(e)}",
+                context={"file": str(self.violations_file)}
+            )
+
+    def persist_alerts(self, alerts: Iterable[Alert]) -> None:
+        """
+        Persist a batch of alert records with a single write.
+
+        Args:
+            alerts: Alert DTOs to persist
+
+        Raises:
+            StorageError: If write fails
+        """
+        payload = "".join(a.model_dump_json() + "\n" for a in alerts)
+        if not payload:
+            return
+        try:
+            with open(self.alerts_file, "a") as f:
+                f.write(payload)
+        except Exception as e:
+            raise StorageError(
+                message=f"Failed to persist alerts: {str(e)}",
+                context={"file": str(self.alerts_file)}
+            )
+
     def query_violations(self, app_id: str, state: str) -> List[Violation]:
         """
         Query violations by application and state.
@@ -132,3 +199,65 @@ class JsonlStorage(Storage):
                     "state": state
                 }
             )
+
+    def identity(self) -> str:
+        """Stable identity: the resolved storage directory."""
+        return f"jsonl:{self.directory.resolve()}"
+
+    def extents(self) -> Dict[str, Tuple[int, int]]:
+        """(inode, byte size) of each record file; (0, 0) if not yet created."""
+        extents = {}
+        for kind, path in (("kpis", self.kpis_file),
+                           ("violations", self.violations_file),
+                           ("alerts", self.alerts_file)):
+            try:
+                stat = path.stat()
+                extents[kind] = (stat.st_ino, stat.st_size)
+            except FileNotFoundError:
+                extents[kind] = (0, 0)
+        return extents
+
+    def load_kpis(self, start: int = 0) -> List[KPIRecord]:
+        """
+        Load KPI records from the start-th line on (all when 0).
+
+        Raises:
+            StorageError: If read fails
+        """
+        return self._load(self.kpis_file, KPIRecord, start)
+
+    def load_violations(self, start: int = 0) -> List[Violation]:
+        """
+        Load violations from the start-th line on (all when 0).
+
+        Raises:
+            StorageError: If read fails
+        """
+        return self._load(self.violations_file, Violation, start)
+
+    def load_alerts(self, start: int = 0) -> List[Alert]:
+        """
+        Load alerts from the start-th line on (all when 0).
+
+        Raises:
+            StorageError: If read fails
+        """
+        return self._load(self.alerts_file, Alert, start)
+
+    def _load(self, path: Path, model, start: int) -> list:
+        """Read records from a JSONL file, skipping the first start lines unparsed."""
+        try:
+            records = []
+            if path.exists():
+                with open(path, "r") as f:
+                    for line in islice(f, start, None):
+                        # A line still being appended is left for the next load
+                        if not line.endswith("\n"):
+                            break
+                        records.append(model(**json.loads(line)))
+            return records
+        except Exception as e:
+            raise StorageError(
+                message=f"Failed to load records: {str(e)}",
+                context={"file": str(path)}
+            )
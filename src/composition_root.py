@@ -4,6 +4,9 @@ Composition Root - Dependency Injection Setup.
 Wires all adapters and modules together.
 """
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from .adapters.clock import SystemClock, FixedClock
 from .adapters.audit import StructlogAuditLogger
 from .adapters.storage.jsonl import JsonlStorage
@@ -22,7 +25,11 @@ from .modules.kpi.calculators import (
     AccessReviewStatusCalculator,
     PolicyViolationsCalculator,
     ExcessivePermissionsCalculator,
-    DormantAccountsCalculator
+    DormantAccountsCalculator,
+    CountKPIAggregator,
+    RowKPIAggregator,
+    GroupKPIAggregator,
+    KPICalculator
 )
 from .modules.policy.rules import PolicyRuleEngine
 from .modules.ai.analyzer import RiskAnalyzer
@@ -36,6 +43,9 @@ class ServiceContainer:
     """
     Service container for dependency injection.
 
+    KPI calculators and the policy engine, risk analyzer and alert
+    generator are built once per container and shared by every caller.
+
     Example:
         container = ServiceContainer.production()
         alerting = container.alert_generator()
@@ -58,12 +68,16 @@ class ServiceContainer:
         self.openai = openai
         self.audit_logger = audit_logger
         self.config = config
+        self._kpi_calculators: Optional[Tuple[KPICalculator, ...]] = None
+        self._calculators: Dict[Type[KPICalculator], KPICalculator] = {}
+        self._services: Dict[str, Any] = {}
+        self._services_lock = threading.Lock()
 
     @staticmethod
-    def production() -> "ServiceContainer":
+    def production(config_dir: str = "./config") -> "ServiceContainer":
         """Create production service container."""
         # Load configuration
-        loader = ConfigLoader(config_dir="./config")
+        loader = ConfigLoader(config_dir=config_dir)
         config = loader.load()
 
         # Validate configuration
@@ -152,50 +166,119 @@ class ServiceContainer:
             config=config
         )
 
+    def warmup(self) -> List[Future]:
+        """
+        Pre-initialize adapters and pipeline services in the background.
+
+        Touches each adapter once and builds the cached pipeline services,
+        so first-use costs overlap with CSV ingestion instead of delaying
+        the first alert. Does not block; failures surface only through the
+        returned futures.
+        """
+        executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="warmup")
+        futures = [
+            executor.submit(self.openai.get_token_count, "ping"),
+            executor.submit(self.policy_engine),
+            executor.submit(self.risk_analyzer),
+            executor.submit(self.alert_generator),
+        ]
+        executor.shutdown(wait=False)
+        return futures
+
+    def close(self) -> None:
+        """Release pooled resources: alert dispatch threads and Slack connections."""
+        generator = self._services.get("alert_generator")
+        if generator is not None:
+            generator.close()
+        self.slack.close()
+
     # Service factory methods
 
     def csv_parser(self) -> CSVParser:
         return CSVParser(clock=self.clock)
 
+    def _calculator(self, calculator_cls: Type[KPICalculator]) -> KPICalculator:
+        # Calculators are stateless beyond storage/clock, so each one is
+        # built once per container
+        calculator = self._calculators.get(calculator_cls)
+        if calculator is None:
+            calculator = calculator_cls(storage=self.storage, clock=self.clock)
+            self._calculators[calculator_cls] = calculator
+        return calculator
+
     def orphan_accounts_calculator(self):
-        return OrphanAccountsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(OrphanAccountsCalculator)
 
     def privileged_accounts_calculator(self):
-        return PrivilegedAccountsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(PrivilegedAccountsCalculator)
 
     def failed_access_calculator(self):
-        return FailedAccessAttemptsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(FailedAccessAttemptsCalculator)
 
     def access_provisioning_time_calculator(self):
-        return AccessProvisioningTimeCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(AccessProvisioningTimeCalculator)
 
     def access_review_status_calculator(self):
-        return AccessReviewStatusCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(AccessReviewStatusCalculator)
 
     def policy_violations_calculator(self):
-        return PolicyViolationsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(PolicyViolationsCalculator)
 
     def excessive_permissions_calculator(self):
-        return ExcessivePermissionsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(ExcessivePermissionsCalculator)
 
     def dormant_accounts_calculator(self):
-        return DormantAccountsCalculator(storage=self.storage, clock=self.clock)
+        return self._calculator(DormantAccountsCalculator)
+
+    def kpi_calculators(self) -> Tuple[KPICalculator, ...]:
+        if self._kpi_calculators is None:
+            self._kpi_calculators = (
+                self.orphan_accounts_calculator(),
+                self.privileged_accounts_calculator(),
+                self.failed_access_calculator(),
+                self.access_provisioning_time_calculator(),
+                self.access_review_status_calculator(),
+                self.policy_violations_calculator(),
+                self.excessive_permissions_calculator(),
+                self.dormant_accounts_calculator(),
+            )
+        return self._kpi_calculators
+
+    def count_kpi_aggregator(self):
+        return CountKPIAggregator(storage=self.storage, clock=self.clock)
+
+    def row_kpi_aggregator(self):
+        return RowKPIAggregator(storage=self.storage, clock=self.clock)
+
+    def group_kpi_aggregator(self):
+        return GroupKPIAggregator(storage=self.storage, clock=self.clock)
+
+    def _service(self, name: str, build: Callable[[], Any]) -> Any:
+        # Built once per container under a lock, so a service requested
+        # while warmup() is still building it is not built twice
+        with self._services_lock:
+            service = self._services.get(name)
+            if service is None:
+                service = build()
+                self._services[name] = service
+            return service
 
     def policy_engine(self) -> PolicyRuleEngine:
-        thresholds = self.config.thresholds.alert_thresholds
-        return PolicyRuleEngine(
+        return self._service("policy_engine", lambda: PolicyRuleEngine(
             storage=self.storage,
             clock=self.clock,
-            thresholds=thresholds
-        )
+            thresholds=self.config.thresholds.alert_thresholds
+        ))
 
     def risk_analyzer(self) -> RiskAnalyzer:
-        return RiskAnalyzer(openai_client=self.openai, clock=self.clock)
+        return self._service(
+            "risk_analyzer", lambda: RiskAnalyzer(openai_client=self.openai, clock=self.clock)
+        )
 
     def alert_generator(self) -> AlertGenerator:
-        return AlertGenerator(
+        return self._service("alert_generator", lambda: AlertGenerator(
             storage=self.storage,
             slack=self.slack,
             email=self.email,
             clock=self.clock
-        )
+        ))
@@ -19,6 +19,19 @@ class Severity(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class ViolationState(str, Enum):
+    """Violation lifecycle states."""
+    NEW = "NEW"
+    RECURRING = "RECURRING"
+    RESOLVED = "RESOLVED"
+
+
+class Persona(str, Enum):
+    """Alert target personas."""
+    COMPLIANCE_OFFICER = "compliance_officer"
+    APP_OWNER = "app_owner"
+
+
 class KPIRecord(BaseModel):
     """
     Single KPI measurement for an application.
@@ -79,14 +92,7 @@ class Violation(BaseModel):
     threshold_breached: Dict[str, float]
     evidence: Dict[str, str]
     detected_at: datetime
-    state: str = "NEW"  # NEW | RECURRING | RESOLVED
-
-    @field_validator('state')
-    @classmethod
-    def valid_state(cls, v: str) -> str:
-        if v not in ["NEW", "RECURRING", "RESOLVED"]:
-            raise ValueError(f'Invalid state: {v}')
-        return v
+    state: ViolationState = ViolationState.NEW
 
 
 class Alert(BaseModel):
@@ -105,14 +111,7 @@ class Alert(BaseModel):
     description: str
     recommendations: List[str] = Field(min_length=3, max_length=5)
     created_at: datetime
-    persona: str  # compliance_officer | app_owner
-
-    @field_validator('persona')
-    @classmethod
-    def valid_persona(cls, v: str) -> str:
-        if v not in ["compliance_officer", "app_owner"]:
-            raise ValueError(f'Invalid persona: {v}')
-        return v
+    persona: Persona
 
 
 class AuditEvent(BaseModel):
@@ -6,7 +6,7 @@ error codes, messages, and context for debugging.
 """
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 class DomainError(Exception):
@@ -27,6 +27,8 @@ class DomainError(Exception):
         self.error_code = error_code
         self.context = context or {}
         self.timestamp = datetime.now()
+        # (timestamp, isoformat) of the last serialization
+        self._iso: Optional[Tuple[datetime, str]] = None
 
     def to_dict(self) -> Dict[str, str]:
         """
@@ -38,10 +40,16 @@ class DomainError(Exception):
         return {
             "error_code": self.error_code,
             "message": self.message,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._timestamp_iso(),
             **self.context
         }
 
+    def _timestamp_iso(self) -> str:
+        """ISO timestamp, formatted once unless timestamp is reassigned."""
+        if self._iso is None or self._iso[0] is not self.timestamp:
+            self._iso = (self.timestamp, self.timestamp.isoformat())
+        return self._iso[1]
+
     def __str__(self) -> str:
         return f"[{self.error_code}] {self.message}"
 
@@ -7,7 +7,7 @@ dependency inversion, testability, and adapter swapping.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 from .dto import Alert, AuditEvent, DeliveryResult, KPIRecord, Violation
 
 
@@ -41,6 +41,9 @@ class SlackSender(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release any connections held between sends (no-op by default)."""
+
 
 class EmailSender(ABC):
     """
@@ -170,6 +173,45 @@ class Storage(ABC):
         """
         pass
 
+    def persist_kpis(self, kpis: Iterable[KPIRecord]) -> None:
+        """
+        Persist a batch of KPI records in one operation.
+
+        Default implementation delegates to persist_kpi per record;
+        adapters should override to write the batch at once.
+
+        Args:
+            kpis: KPIRecord DTOs to persist
+        """
+        for kpi in kpis:
+            self.persist_kpi(kpi)
+
+    def persist_violations(self, violations: Iterable[Violation]) -> None:
+        """
+        Persist a batch of violation records in one operation.
+
+        Default implementation delegates to persist_violation per record;
+        adapters should override to write the batch at once.
+
+        Args:
+            violations: Violation DTOs to persist
+        """
+        for violation in violations:
+            self.persist_violation(violation)
+
+    def persist_alerts(self, alerts: Iterable[Alert]) -> None:
+        """
+        Persist a batch of alert records in one operation.
+
+        Default implementation delegates to persist_alert per record;
+        adapters should override to write the batch at once.
+
+        Args:
+            alerts: Alert DTOs to persist
+        """
+        for alert in alerts:
+            self.persist_alert(alert)
+
     @abstractmethod
     def query_violations(self, app_id: str, state: str) -> List[Violation]:
         """
@@ -184,6 +226,80 @@ class Storage(ABC):
         """
         pass
 
+    def load_kpis(self, start: int = 0) -> List[KPIRecord]:
+        """
+        Load KPI records in the order they were persisted.
+
+        Optional: adapters that cannot read records back do not override it.
+
+        Args:
+            start: Number of records to skip; pass the count already read
+                to get only records persisted since
+
+        Returns:
+            List of KPI records
+
+        Raises:
+            NotImplementedError: If the adapter does not support loading
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support load_kpis()")
+
+    def load_violations(self, start: int = 0) -> List[Violation]:
+        """
+        Load violation records in the order they were persisted.
+
+        Optional: adapters that cannot read records back do not override it.
+
+        Args:
+            start: Number of records to skip; pass the count already read
+                to get only records persisted since
+
+        Returns:
+            List of violations
+
+        Raises:
+            NotImplementedError: If the adapter does not support loading
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support load_violations()")
+
+    def load_alerts(self, start: int = 0) -> List[Alert]:
+        """
+        Load alert records in the order they were persisted.
+
+        Optional: adapters that cannot read records back do not override it.
+
+        Args:
+            start: Number of records to skip; pass the count already read
+                to get only records persisted since
+
+        Returns:
+            List of alerts
+
+        Raises:
+            NotImplementedError: If the adapter does not support loading
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support load_alerts()")
+
+    def identity(self) -> str:
+        """
+        Identify the backing store, e.g. to key caches built from its records.
+
+        Default implementation is unique per adapter instance; adapters
+        backed by a durable location should return a stable identity for it.
+        """
+        return f"{type(self).__name__}:{id(self)}"
+
+    def extents(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Describe how far each record stream ("kpis", "violations",
+        "alerts") extends, as a (generation, size) pair.
+
+        A cache built from load_* offsets is stale if a stream's generation
+        changed or its size shrank (e.g. a rotated or truncated file).
+        Default: {} (no streams can be checked).
+        """
+        return {}
+
 
 class AuditLogger(ABC):
     """
@@ -11,65 +11,112 @@ Runs daily processing pipeline:
 
 import sys
 from pathlib import Path
+from typing import Dict, List
+import pandas as pd
 from .composition_root import ServiceContainer
+from .interfaces.dto import KPIRecord
+
+# Number of applications processed per run in demo mode
+MAX_DEMO_APPS = 10
+
+# Read buffer for the input CSV (1 MiB)
+CSV_READ_BUFFER = 1 << 20
 
 
 def main():
     """Main pipeline execution."""
+    # Copy-on-Write: per-app slices stay cheap views, and no calculator needs
+    # a defensive .copy() to avoid SettingWithCopyWarning
+    pd.set_option("mode.copy_on_write", True)
+
     try:
         # Initialize services
         container = ServiceContainer.production()
+        container.warmup()
 
         # Get pipeline components
         csv_parser = container.csv_parser()
         policy_engine = container.policy_engine()
         alert_gen = container.alert_generator()
 
-        # Parse input CSV
+        # Open input CSV once; a missing file is reported from the open itself
         csv_path = Path("./data/uam_export.csv")
-        if not csv_path.exists():
+        try:
+            csv_file = open(csv_path, "rb", buffering=CSV_READ_BUFFER)
+        except FileNotFoundError:
             print(f"Error: CSV file not found at {csv_path}")
             return 1
 
+        # Stream the CSV, keeping rows only for the apps we will process
         print(f"Parsing CSV from {csv_path}...")
-        df, is_full_load = csv_parser.parse(str(csv_path))
-        print(f"Loaded {len(df)} records (full_load={is_full_load})")
-
-        # Process each application
-        app_ids = df["app_id"].unique() if "app_id" in df.columns else []
+        app_frames: Dict[str, List[pd.DataFrame]] = {}
+        seen_apps = set()
+        total_records = 0
+        with csv_file:
+            for chunk in csv_parser.parse_streaming(csv_file):
+                total_records += len(chunk)
+                if "app_id" not in chunk.columns:
+                    continue
+                for app_id, group in chunk.groupby("app_id", sort=False, observed=True):
+                    seen_apps.add(app_id)
+                    if app_id in app_frames or len(app_frames) < MAX_DEMO_APPS:
+                        app_frames.setdefault(app_id, []).append(group)
+
+        is_full_load = (
+            not seen_apps or len(seen_apps) > csv_parser.FULL_LOAD_APP_THRESHOLD
+        )
+        print(f"Loaded {total_records} records (full_load={is_full_load})")
+
+        # Process each application; per-app output is buffered and written once
         total_violations = 0
         total_alerts = 0
+        report: List[str] = []
+        orphan_calc = container.orphan_accounts_calculator()
+        pending_kpis: List[KPIRecord] = []
+
+        for app_id, frames in app_frames.items():
+            app_df = pd.concat(frames, ignore_index=True)
 
-        for app_id in app_ids[:10]:  # Process first 10 apps for demo
             # Step 1: Calculate KPIs
             kpi_values = {}
             try:
-                orphan_calc = container.orphan_accounts_calculator()
-                kpi = orphan_calc.compute(df, str(app_id))
+                kpi = orphan_calc.measure(app_df, str(app_id))
+                pending_kpis.append(kpi)
                 kpi_values["orphan_accounts"] = kpi.value
             except Exception as e:
-                print(f"KPI computation failed for {app_id}: {e}")
+                report.append(f"KPI computation failed for {app_id}: {e}")
 
             # Step 2: Evaluate policies
             try:
                 violations = policy_engine.evaluate(str(app_id), kpi_values)
                 total_violations += len(violations)
 
-                # Step 3-5: For each violation, analyze and alert
-                for violation in violations:
+                # Step 3-5: Alert on all violations, persisted in one batch
+                if violations:
                     try:
-                        alert = alert_gen.generate_and_send(violation)
-                        total_alerts += 1
-                        print(f"Alert sent for {app_id}: {alert.alert_id}")
+                        alerts = alert_gen.generate_batch(violations)
+                        total_alerts += len(alerts)
+                        for alert in alerts:
+                            report.append(f"Alert sent for {app_id}: {alert.alert_id}")
                     except Exception as e:
-                        print(f"Alert generation failed: {e}")
+                        report.append(f"Alert generation failed: {e}")
 
             except Exception as e:
-                print(f"Policy evaluation failed for {app_id}: {e}")
-
-        print("\nProcessing complete:")
-        print(f"  Violations detected: {total_violations}")
-        print(f"  Alerts sent: {total_alerts}")
+                report.append(f"Policy evaluation failed for {app_id}: {e}")
+
+        # Persist all KPIs for the run in one batch
+        try:
+            container.storage.persist_kpis(pending_kpis)
+        except Exception as e:
+            report.append(f"KPI persistence failed: {e}")
+
+        report.extend([
+            "\nProcessing complete:",
+            f"  Violations detected: {total_violations}",
+            f"  Alerts sent: {total_alerts}",
+        ])
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
 
         return 0
 
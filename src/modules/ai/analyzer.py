@@ -2,11 +2,32 @@
 AI Risk Analysis Module using OpenAI.
 """
 
+import json
+from typing import Final, Tuple
 from ...interfaces.dto import RiskAnalysisResult
 from ...interfaces.ports import OpenAIClient, Clock
 from ...interfaces.errors import ProcessingError
 
 
+_PROMPT_TEMPLATE: Final[str] = """
+Analyze the following KPI anomaly:
+- Application: {app_id}
+- KPI: {kpi_name}
+- Value: {kpi_value}
+
+Provide:
+1. Risk score (0-100)
+2. Confidence (0-100)
+3. Root cause explanation
+4. Risk factors
+
+Format as JSON.
+"""
+
+# Confidence reported when the AI response carries none
+_DEFAULT_CONFIDENCE: Final[float] = 75.0
+
+
 class RiskAnalyzer:
     """
     Analyzes risks using AI.
@@ -28,34 +49,22 @@ class RiskAnalyzer:
         """
         try:
             # Build prompt for AI analysis
-            prompt = f"""
-Analyze the following KPI anomaly:
-- Application: {app_id}
-- KPI: {kpi_name}
-- Value: {kpi_value}
-
-Provide:
-1. Risk score (0-100)
-2. Confidence (0-100)
-3. Root cause explanation
-4. Risk factors
-
-Format as JSON.
-"""
+            prompt = _PROMPT_TEMPLATE.format(
+                app_id=app_id, kpi_name=kpi_name, kpi_value=kpi_value
+            )
 
             # Get AI analysis
             response = self.openai.analyze(prompt, max_tokens=500)
 
-            # Parse response (simplified)
-            risk_score = self._extract_risk_score(response, kpi_value)
-            confidence = self._extract_confidence(response)
+            # Parse response
+            risk_score, confidence, explanation = self._parse_ai(response, kpi_value)
 
             result = RiskAnalysisResult(
                 app_id=app_id,
                 kpi_name=kpi_name,
                 risk_score=risk_score,
                 confidence=confidence,
-                explanation=response[:200],  # First 200 chars
+                explanation=explanation,
                 factors={"kpi_value": kpi_value},
                 analyzed_at=self.clock.now()
             )
@@ -68,13 +77,32 @@ Format as JSON.
                 context={"app_id": app_id, "kpi": kpi_name}
             )
 
+    def _parse_ai(self, response: str, kpi_value: float) -> Tuple[float, float, str]:
+        """
+        Parse risk score, confidence and explanation from AI response.
+
+        All fields come from a single JSON parse. Falls back to the
+        KPI-value heuristic when the response is not a JSON object
+        with a numeric risk_score.
+
+        Returns:
+            (risk_score, confidence, explanation) with scores clamped to 0-100
+        """
+        try:
+            obj = json.loads(response)
+            risk_score = min(100.0, max(0.0, float(obj["risk_score"])))
+            confidence = min(100.0, max(0.0, float(obj.get("confidence", _DEFAULT_CONFIDENCE))))
+            explanation = str(obj.get("explanation") or response)[:200]
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return (
+                self._extract_risk_score(response, kpi_value),
+                _DEFAULT_CONFIDENCE,
+                response[:200]  # First 200 chars
+            )
+        return risk_score, confidence, explanation
+
     def _extract_risk_score(self, response: str, kpi_value: float) -> float:
         """Extract risk score from response."""
         # Simple heuristic: scale KPI value to 0-100
         score = min(100.0, kpi_value * 10)
         return score
-
-    def _extract_confidence(self, response: str) -> float:
-        """Extract confidence from response."""
-        # Default to 75% confidence
-        return 75.0
@@ -2,17 +2,25 @@
 Alert Generator Module.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 from typing import List
-from ...interfaces.dto import Alert, Violation, Severity
+from ...interfaces.dto import Alert, DeliveryResult, Persona, Violation, Severity
 from ...interfaces.ports import Storage, SlackSender, EmailSender, Clock
 from ...interfaces.errors import ProcessingError
 
+# Severities emailed one by one; the rest of a batch goes out as one digest
+_URGENT_SEVERITIES = frozenset((Severity.HIGH, Severity.CRITICAL))
+
 
 class AlertGenerator:
     """
     Generates and dispatches alerts.
 
+    Batches share one two-thread dispatch pool for the generator's
+    lifetime; call close() on shutdown.
+
     Example:
         gen = AlertGenerator(storage, slack, email, clock)
         result = gen.generate_and_send(violation)
@@ -29,6 +37,12 @@ class AlertGenerator:
         self.slack = slack
         self.email = email
         self.clock = clock
+        self.delivery_failures = 0
+        self._failures_lock = threading.Lock()
+        # One thread per channel; threads start on first use and are reused
+        self._dispatch_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="alert-dispatch"
+        )
 
     def generate_and_send(self, violation: Violation) -> Alert:
         """
@@ -37,34 +51,14 @@ class AlertGenerator:
         Returns generated Alert.
         """
         try:
-            # Create alert
-            alert = Alert(
-                alert_id=str(uuid4()),
-                app_id=violation.app_id,
-                severity=violation.severity,
-                risk_score=self._calculate_risk_score(violation),
-                violation_ids=[violation.violation_id],
-                title=f"{violation.severity.value} violation in {violation.app_id}",
-                description=f"Rule {violation.rule_id} triggered with {list(violation.kpi_values.values())[0]}",
-                recommendations=self._get_recommendations(violation),
-                created_at=self.clock.now(),
-                persona="compliance_officer"
-            )
+            alert = self._build_alert(violation)
 
             # Persist alert
             self.storage.persist_alert(alert)
 
-            # Send via Slack
-            try:
-                self.slack.send(alert)
-            except Exception:
-                pass  # Continue to email
-
-            # Send via Email
-            try:
-                self.email.send(alert)
-            except Exception:
-                pass
+            # Dispatch to both channels; a Slack failure must not block email
+            self._safe_send(self.slack, alert)
+            self._safe_send(self.email, alert)
 
             return alert
 
@@ -74,6 +68,82 @@ class AlertGenerator:
                 context={"violation_id": violation.violation_id}
             )
 
+    def generate_batch(self, violations: List[Violation]) -> List[Alert]:
+        """
+        Generate alerts for many violations and dispatch via Slack/Email.
+
+        All alerts are persisted with a single storage call before dispatch.
+        Slack and email deliveries run concurrently, one thread per channel,
+        each channel sending in violation order. HIGH/CRITICAL alerts are
+        emailed individually; MEDIUM/LOW alerts share one digest email.
+
+        Returns generated Alerts in violation order.
+        """
+        try:
+            alerts = [self._build_alert(violation) for violation in violations]
+            self.storage.persist_alerts(alerts)
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Alert generation failed: {str(e)}",
+                context={"violation_count": str(len(violations))}
+            )
+
+        if alerts:
+            slack_done = self._dispatch_pool.submit(self._send_all, self.slack, alerts)
+            email_done = self._dispatch_pool.submit(self._send_email_batch, alerts)
+            slack_done.result()
+            email_done.result()
+
+        return alerts
+
+    def close(self) -> None:
+        """Stop the dispatch threads once in-flight batches finish."""
+        self._dispatch_pool.shutdown(wait=True)
+
+    def _send_all(self, sender, alerts: List[Alert]) -> List[DeliveryResult]:
+        """Send alerts through one channel in order."""
+        return [self._safe_send(sender, alert) for alert in alerts]
+
+    def _build_alert(self, violation: Violation) -> Alert:
+        """Build alert DTO from violation."""
+        return Alert(
+            alert_id=str(uuid4()),
+            app_id=violation.app_id,
+            severity=violation.severity,
+            risk_score=self._calculate_risk_score(violation),
+            violation_ids=[violation.violation_id],
+            title=f"{violation.severity.value} violation in {violation.app_id}",
+            description=f"Rule {violation.rule_id} triggered with {list(violation.kpi_values.values())[0]}",
+            recommendations=self._get_recommendations(violation),
+            created_at=self.clock.now(),
+            persona=Persona.COMPLIANCE_OFFICER
+        )
+
+    def _send_email_batch(self, alerts: List[Alert]) -> List[DeliveryResult]:
+        """Email urgent alerts one by one and the remainder as a single digest."""
+        results = [
+            self._safe_send(self.email, alert)
+            for alert in alerts if alert.severity in _URGENT_SEVERITIES
+        ]
+        routine = [alert for alert in alerts if alert.severity not in _URGENT_SEVERITIES]
+        if routine:
+            try:
+                results.append(self.email.send_digest(routine))
+            except Exception as e:
+                with self._failures_lock:
+                    self.delivery_failures += 1
+                results.append(DeliveryResult(success=False, error=str(e), retries=0))
+        return results
+
+    def _safe_send(self, sender, alert: Alert) -> DeliveryResult:
+        """Send alert via sender, converting any failure into a DeliveryResult."""
+        try:
+            return sender.send(alert)
+        except Exception as e:
+            with self._failures_lock:
+                self.delivery_failures += 1
+            return DeliveryResult(success=False, error=str(e), retries=0)
+
     def _calculate_risk_score(self, violation: Violation) -> float:
         """Calculate risk score from violation."""
         # Simple heuristic based on severity
@@ -4,13 +4,17 @@ Configuration Loader for UAM Compliance Intelligence System.
 Loads and validates configuration from YAML/JSON files.
 """
 
-import yaml
+import copy
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field
 from ...interfaces.errors import ConfigurationError
 from ...interfaces.dto import Thresholds
 
+# Parsed YAML keyed by (path, mtime_ns, size); edited files miss naturally
+_yaml_cache: Dict[Tuple[str, int, int], Any] = {}
+
 
 class NotificationSettings(BaseModel):
     """Notification channel settings."""
@@ -78,21 +82,23 @@ class ConfigLoader:
             notifications_data = self._load_yaml("notifications.yaml")
             notifications = NotificationSettings(**notifications_data)
 
-            # Load AI settings from environment or config
-            import os
-            ai_settings = AISettings(
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
-                model=os.getenv("OPENAI_MODEL", "gpt-4-turbo")
+            # Load AI settings from environment or config. Environment values
+            # are already plain strings, so these models skip re-validation;
+            # YAML-sourced sections above are still fully validated.
+            env = os.environ
+            ai_settings = AISettings.model_construct(
+                openai_api_key=env.get("OPENAI_API_KEY"),
+                model=env.get("OPENAI_MODEL", "gpt-4-turbo")
             )
 
             # Create system config
-            config = SystemConfig(
+            config = SystemConfig.model_construct(
                 thresholds=thresholds_obj,
                 notifications=notifications,
                 ai_settings=ai_settings,
-                storage_type=os.getenv("STORAGE_TYPE", "jsonl"),
-                db_url=os.getenv("DATABASE_URL"),
-                log_level=os.getenv("LOG_LEVEL", "INFO")
+                storage_type=env.get("STORAGE_TYPE", "jsonl"),
+                db_url=env.get("DATABASE_URL"),
+                log_level=env.get("LOG_LEVEL", "INFO")
             )
 
             return config
@@ -107,6 +113,8 @@ class ConfigLoader:
         """
         Load YAML file from config directory.
 
+        Parsed content is cached until the file's mtime or size changes.
+
         Args:
             filename: Name of YAML file
 
@@ -117,17 +125,33 @@ class ConfigLoader:
             ConfigurationError: If file not found or invalid YAML
         """
         filepath = self.config_dir / filename
-        if not filepath.exists():
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
             raise ConfigurationError(
                 message=f"Configuration file not found: {filename}",
                 context={"filepath": str(filepath)}
             )
 
-        try:
-            with open(filepath, "r") as f:
-                return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(
-                message=f"Invalid YAML in {filename}: {str(e)}",
-                context={"filepath": str(filepath)}
-            )
+        key = (str(filepath), st.st_mtime_ns, st.st_size)
+        if key not in _yaml_cache:
+            # Imported on first parse so cache hits never pay for PyYAML
+            import yaml
+
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            try:
+                with open(filepath, "r") as f:
+                    data = yaml.load(f, Loader=loader)
+            except yaml.YAMLError as e:
+                raise ConfigurationError(
+                    message=f"Invalid YAML in {filename}: {str(e)}",
+                    context={"filepath": str(filepath)}
+                )
+            # Drop entries for earlier versions of this file
+            for stale in [k for k in _yaml_cache if k[0] == key[0]]:
+                del _yaml_cache[stale]
+            _yaml_cache[key] = data
+
+        # Callers may mutate the result, so hand out a copy
+        return copy.deepcopy(_yaml_cache[key])
@@ -4,9 +4,12 @@ CSV Parser for UAM data ingestion.
 
 import pandas as pd
 from pathlib import Path
-from typing import Tuple
+from typing import IO, Iterator, Optional, Tuple, Union
 from ...interfaces.errors import ValidationError, ProcessingError
 
+# Whole-file reads parse straight from a memory map of the file
+_READ_OPTIONS = {"engine": "c", "memory_map": True}
+
 
 class CSVParser:
     """
@@ -17,8 +20,53 @@ class CSVParser:
         df, is_full = parser.parse("uam_data.csv")
     """
 
-    def __init__(self, clock):
+    # Heuristic: exports covering more than this many apps are full loads
+    FULL_LOAD_APP_THRESHOLD = 100
+
+    # Rows scanned per step when counting distinct apps for load detection
+    FULL_LOAD_SCAN_BLOCK = 65_536
+
+    # Identifier columns are read as strings, skipping numeric inference
+    # (which would also strip leading zeros from IDs such as "007")
+    ID_DTYPES = {"app_id": str, "user_id": str, "manager_id": str}
+
+    # Low-cardinality label columns stored as categoricals (int codes)
+    CATEGORY_COLUMNS = ("role", "environment", "status")
+
+    # Flag columns stored as nullable booleans (missing stays NA)
+    BOOLEAN_COLUMNS = ("is_privileged",)
+
+    # Accepted flag spellings, matched case-insensitively after stripping
+    # whitespace; any other value becomes NA rather than failing the file
+    BOOLEAN_TOKENS = {
+        **dict.fromkeys(("true", "t", "yes", "y", "1"), True),
+        **dict.fromkeys(("false", "f", "no", "n", "0"), False),
+    }
+
+    # Columns converted to datetime once at ingestion
+    DATE_COLUMNS = (
+        "last_review_date",
+        "last_login_date",
+        "account_created_date",
+        "access_request_date",
+        "access_granted_date",
+        "exit_date",
+    )
+
+    # Exports write ISO dates, so parsing skips per-column format guessing
+    DATE_FORMAT = "ISO8601"
+
+    # Explicit dtypes for read_csv, so known columns skip type inference
+    # (columns absent from a file are ignored). Flags are read as categories
+    # so their few distinct spellings are mapped once in _normalize
+    READ_DTYPES = {
+        **ID_DTYPES,
+        **{column: "category" for column in CATEGORY_COLUMNS + BOOLEAN_COLUMNS},
+    }
+
+    def __init__(self, clock, chunksize: int = 500_000):
         self.clock = clock
+        self.chunksize = chunksize
 
     def parse(self, filepath: str) -> Tuple[pd.DataFrame, bool]:
         """
@@ -35,7 +83,9 @@ class CSVParser:
                     context={"filepath": str(filepath)}
                 )
 
-            df = pd.read_csv(filepath)
+            df = self._normalize(
+                pd.read_csv(filepath, dtype=self.READ_DTYPES, **_READ_OPTIONS)
+            )
             is_full = self._detect_full_load(df)
             return df, is_full
 
@@ -45,9 +95,118 @@ class CSVParser:
                 context={"filepath": str(filepath)}
             )
 
+    def parse_stream(self, source: IO) -> Tuple[pd.DataFrame, bool]:
+        """
+        Parse CSV from an open text or binary file-like object (e.g. StringIO).
+
+        The source is read to the end and left open; the caller owns it.
+
+        Returns:
+            (DataFrame, is_full_load)
+        """
+        try:
+            df = self._normalize(pd.read_csv(source, dtype=self.READ_DTYPES))
+            return df, self._detect_full_load(df)
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"CSV parsing failed: {str(e)}",
+                context={"source": str(getattr(source, "name", type(source).__name__))}
+            )
+
+    def parse_dataframe(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, bool]:
+        """
+        Normalize an in-memory UAM frame and detect full or incremental load.
+
+        Same result as parse() without a CSV round-trip; the caller's frame
+        is left unmodified.
+
+        Returns:
+            (DataFrame, is_full_load)
+        """
+        try:
+            df = self._normalize(df.copy(deep=False))
+            return df, self._detect_full_load(df)
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"DataFrame parsing failed: {str(e)}",
+                context={"rows": str(len(df))}
+            )
+
+    def parse_streaming(
+        self, source: Union[str, IO[bytes]], chunksize: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse CSV file in fixed-size chunks.
+
+        Peak memory is bounded by chunksize rows instead of file size.
+        Callers are responsible for full-load detection across chunks.
+
+        Args:
+            source: File path, or an already-open binary file handle
+                (left open; the caller owns it)
+            chunksize: Rows per yielded chunk (defaults to self.chunksize)
+
+        Yields:
+            DataFrame chunks in file order
+        """
+        try:
+            # No separate exists() probe: a missing path surfaces as
+            # FileNotFoundError from the single open inside read_csv
+            with pd.read_csv(source, dtype=self.READ_DTYPES, chunksize=chunksize or self.chunksize) as reader:
+                for chunk in reader:
+                    yield self._normalize(chunk)
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"CSV parsing failed: {str(e)}",
+                context={"filepath": str(getattr(source, "name", source))}
+            )
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert known date and label columns to their working dtypes."""
+        for column in self.DATE_COLUMNS:
+            if column in df.columns:
+                # Unparseable values become NaT
+                df[column] = pd.to_datetime(
+                    df[column], format=self.DATE_FORMAT, errors="coerce", cache=True
+                )
+        for column in self.BOOLEAN_COLUMNS:
+            if column in df.columns:
+                df[column] = self._to_flag(df[column])
+        # No-op for CSV reads (already typed by READ_DTYPES); needed for
+        # in-memory frames
+        for column in self.CATEGORY_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        return df
+
+    def _to_flag(self, series: pd.Series) -> pd.Series:
+        """Convert a flag column to nullable boolean using BOOLEAN_TOKENS."""
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            return series.astype("boolean")
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype("category")
+        # Look up each distinct spelling once; unknown ones map to NA
+        flags = {
+            value: self.BOOLEAN_TOKENS.get(str(value).strip().lower())
+            for value in series.cat.categories
+        }
+        return series.map(flags).astype("boolean")
+
     def _detect_full_load(self, df: pd.DataFrame) -> bool:
         """Detect if this is full or incremental load."""
         # Heuristic: if we have >100 apps, likely full load
-        if "app_id" in df.columns:
-            return len(df["app_id"].unique()) > 100
-        return True
+        if "app_id" not in df.columns:
+            return True
+
+        # Scan in blocks and stop as soon as the threshold is exceeded,
+        # instead of hashing every app_id in the file
+        app_ids = df["app_id"]
+        seen = set()
+        for start in range(0, len(app_ids), self.FULL_LOAD_SCAN_BLOCK):
+            seen.update(app_ids.iloc[start:start + self.FULL_LOAD_SCAN_BLOCK].unique())
+            if len(seen) > self.FULL_LOAD_APP_THRESHOLD:
+                return True
+        return False
@@ -2,57 +2,210 @@
 KPI Calculator implementations.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import timedelta
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from ...interfaces.dto import KPIRecord
 from ...interfaces.ports import Storage, Clock
 from ...interfaces.errors import ProcessingError
 
 
+# Columns orphan detection needs across chunks
+_ID_COLUMNS = ("app_id", "user_id", "manager_id")
+
+# int64 view of NaT
+_NAT = np.iinfo(np.int64).min
+_NS_PER_DAY = 86_400_000_000_000
+
+_PRIVILEGED_ROLES = frozenset(("ADMIN", "ROOT"))
+_HIGH_PRIVILEGE_ROLES = frozenset(("ADMIN", "SUPERUSER", "ROOT", "DBA"))
+_PROD_ENVIRONMENTS = frozenset(("PROD", "PRODUCTION"))
+
+
+@lru_cache(maxsize=None)
+def _member_values(members: frozenset) -> np.ndarray:
+    """Materialize a member set as an array once; isin would rebuild it per call."""
+    return np.array(sorted(members), dtype=object)
+
+
+def _isin(values: pd.Series, members: frozenset) -> pd.Series:
+    """
+    Membership test that uses a category lookup table when possible.
+
+    For categorical columns the few categories are tested once and each row
+    indexes that table by its integer code; missing values (code -1) hit the
+    trailing False entry.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        lut = np.append(values.cat.categories.isin(_member_values(members)), False)
+        return pd.Series(lut[values.cat.codes.to_numpy()], index=values.index)
+    return values.isin(_member_values(members))
+
+
+def _as_datetime(values: pd.Series) -> pd.Series:
+    """Return values as datetime, parsing only if ingestion has not already."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce', cache=True)
+
+
+def _flag(values: pd.Series) -> pd.Series:
+    """Boolean mask from a flag column; missing values count as False."""
+    if pd.api.types.is_bool_dtype(values) and not values.hasnans:
+        return values.astype(bool)
+    if isinstance(values.dtype, pd.BooleanDtype):
+        # Parsed flags: fill missing while converting, in one copy
+        return pd.Series(values.to_numpy(dtype=bool, na_value=False), index=values.index)
+    return values.astype("boolean").fillna(False).astype(bool)
+
+
+def _has_value(values: pd.Series) -> pd.Series:
+    """Non-missing mask; raw text columns also treat empty strings as missing."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.notna()
+    return values.notna() & (values.astype("string").str.len() > 0).fillna(False)
+
+
+def _before(dates: pd.Series, cutoff: datetime) -> np.ndarray:
+    """Mask of non-missing dates earlier than cutoff, compared as int64 ns."""
+    ns = dates.to_numpy(dtype="datetime64[ns]").view("i8")
+    return (ns != _NAT) & (ns < np.datetime64(cutoff, "ns").view("i8"))
+
+
+def _active(app_data: pd.DataFrame) -> np.ndarray:
+    """Mask of active accounts, or all rows when status is not exported."""
+    if "status" in app_data.columns:
+        return (app_data["status"] == "active").to_numpy(dtype=bool)
+    return np.ones(len(app_data), dtype=bool)
+
+
+def _mask(condition) -> np.ndarray:
+    """Boolean array from a mask Series (missing counts as False) or array."""
+    if isinstance(condition, pd.Series):
+        return condition.to_numpy(dtype=bool, na_value=False)
+    return condition
+
+
+def _all(*conditions) -> np.ndarray:
+    """Rows meeting every condition, combined in one logical_and pass."""
+    if len(conditions) == 1:
+        return _mask(conditions[0])
+    return np.logical_and.reduce([_mask(c) for c in conditions])
+
+
+def _count_all(*conditions) -> int:
+    """Count rows meeting every condition."""
+    return int(np.count_nonzero(_all(*conditions)))
+
+
+def split_by_app(data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Split a multi-app frame into per-app slices in a single groupby pass."""
+    # observed=True: a categorical app_id yields no empty slices for unused categories
+    return {app_id: group for app_id, group in data.groupby("app_id", sort=False, observed=True)}
+
+
+def compute_kpis_batch(
+    calculators: Sequence["KPICalculator"],
+    groups: Dict[str, pd.DataFrame],
+    storage: Storage
+) -> List[KPIRecord]:
+    """
+    Measure every calculator on every per-app slice, then persist once.
+
+    Args:
+        calculators: KPI calculators to run
+        groups: Per-app frames, e.g. from split_by_app
+        storage: Storage receiving all records in one persist_kpis call
+
+    Returns:
+        KPIRecords in app then calculator order
+    """
+    kpis = [
+        calculator.measure(app_data, str(app_id))
+        for app_id, app_data in groups.items()
+        for calculator in calculators
+    ]
+    storage.persist_kpis(kpis)
+    return kpis
+
+
 class KPICalculator:
     """Base class for KPI calculators."""
 
+    kpi_name = ""
+
     def __init__(self, storage: Storage, clock: Clock):
         self.storage = storage
         self.clock = clock
 
     def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
-        """Compute KPI for application."""
+        """Compute KPI for application from a multi-app frame."""
+        try:
+            app_data = data[data["app_id"] == app_id]
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute {self.kpi_name}: {str(e)}",
+                context={"app_id": app_id}
+            )
+        return self.compute_app(app_data, app_id)
+
+    def compute_app(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
+        """Compute and persist KPI from rows already filtered to app_id (see split_by_app)."""
+        kpi = self.measure(app_data, app_id)
+        try:
+            self.storage.persist_kpi(kpi)
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute {self.kpi_name}: {str(e)}",
+                context={"app_id": app_id}
+            )
+        return kpi
+
+    def compute_from_group(self, group: pd.DataFrame) -> KPIRecord:
+        """Compute and persist KPI for one groupby("app_id") group, taking app_id from its rows."""
+        try:
+            app_id = str(group["app_id"].iat[0])
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute {self.kpi_name}: {str(e)}",
+                context={"rows": str(len(group))}
+            )
+        return self.compute_app(group, app_id)
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
+        """Compute KPI for one app's rows without persisting it."""
         raise NotImplementedError
 
 
 class OrphanAccountsCalculator(KPICalculator):
     """Calculates orphan accounts KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "orphan_accounts"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count orphan accounts (accounts whose manager is not in the system)."""
         try:
-            # Filter for this app
-            app_data = data[data["app_id"] == app_id]
-
             # Count orphan accounts: active users whose manager_id is not in user_id list
             orphan_count = 0
             if "manager_id" in app_data.columns and "user_id" in app_data.columns:
-                orphan_accounts = app_data[
-                    (app_data["manager_id"].notna()) & 
-                    (~app_data["manager_id"].isin(app_data["user_id"]))
-                ]
-                orphan_count = len(orphan_accounts)
+                managers = app_data["manager_id"]
+                orphan_count = _count_all(
+                    managers.notna(),
+                    ~managers.isin(app_data["user_id"].dropna().unique())
+                )
             elif "manager_id" in app_data.columns:
                 # Fallback: count non-null manager_ids (assuming they're orphan)
-                orphan_accounts = app_data[app_data["manager_id"].notna()]
-                orphan_count = len(orphan_accounts)
+                orphan_count = _count_all(app_data["manager_id"].notna())
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="orphan_accounts",
                 value=float(orphan_count),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute orphan_accounts: {str(e)}",
@@ -63,28 +216,25 @@ class OrphanAccountsCalculator(KPICalculator):
 class PrivilegedAccountsCalculator(KPICalculator):
     """Calculates privileged accounts KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "privileged_accounts"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count privileged accounts."""
         try:
-            app_data = data[data["app_id"] == app_id]
-
             if "is_privileged" in app_data.columns:
-                privileged = len(app_data[app_data["is_privileged"]])
+                privileged = _count_all(_flag(app_data["is_privileged"]))
             elif "role" in app_data.columns:
-                privileged = len(app_data[app_data["role"].isin(["ADMIN", "ROOT"])])
+                privileged = _count_all(_isin(app_data["role"], _PRIVILEGED_ROLES))
             else:
                 privileged = 0
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="privileged_accounts",
                 value=float(privileged),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute privileged_accounts: {str(e)}",
@@ -95,28 +245,25 @@ class PrivilegedAccountsCalculator(KPICalculator):
 class FailedAccessAttemptsCalculator(KPICalculator):
     """Calculates failed access attempts KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "failed_access_attempts"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count failed access attempts."""
         try:
-            app_data = data[data["app_id"] == app_id]
-
             if "failed_attempts" in app_data.columns:
                 failed = int(app_data["failed_attempts"].sum())
             elif "access_result" in app_data.columns:
-                failed = len(app_data[app_data["access_result"] == "FAILED"])
+                failed = _count_all(app_data["access_result"] == "FAILED")
             else:
                 failed = 0
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="failed_access_attempts",
                 value=float(failed),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute failed_access_attempts: {str(e)}",
@@ -127,41 +274,33 @@ class FailedAccessAttemptsCalculator(KPICalculator):
 class AccessProvisioningTimeCalculator(KPICalculator):
     """Calculates average access provisioning time KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "access_provisioning_time"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Calculate average time between access request and grant."""
         try:
-            app_data = data[data["app_id"] == app_id].copy()
-
             avg_days = 0.0
             if "access_request_date" in app_data.columns and "access_granted_date" in app_data.columns:
-                # Convert to datetime
-                app_data["access_request_date"] = pd.to_datetime(app_data["access_request_date"], errors='coerce')
-                app_data["access_granted_date"] = pd.to_datetime(app_data["access_granted_date"], errors='coerce')
+                requested = _as_datetime(app_data["access_request_date"]).to_numpy(dtype="datetime64[ns]").view("i8")
+                granted = _as_datetime(app_data["access_granted_date"]).to_numpy(dtype="datetime64[ns]").view("i8")
                 
                 # Filter out rows with missing dates
-                valid_rows = app_data[
-                    app_data["access_request_date"].notna() & 
-                    app_data["access_granted_date"].notna()
-                ]
+                valid = (requested != _NAT) & (granted != _NAT)
                 
-                if len(valid_rows) > 0:
-                    # Calculate difference in days
-                    time_diff = (valid_rows["access_granted_date"] - valid_rows["access_request_date"]).dt.days
-                    # Filter out negative values (granted before requested)
-                    time_diff = time_diff[time_diff >= 0]
-                    if len(time_diff) > 0:
-                        avg_days = float(time_diff.mean())
-
-            kpi = KPIRecord(
+                # Whole days between request and grant (floored, like .dt.days)
+                days = (granted[valid] - requested[valid]) // _NS_PER_DAY
+                # Filter out negative values (granted before requested)
+                days = days[days >= 0]
+                if days.size > 0:
+                    avg_days = float(days.mean())
+
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="access_provisioning_time",
                 value=avg_days,
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute access_provisioning_time: {str(e)}",
@@ -172,45 +311,28 @@ class AccessProvisioningTimeCalculator(KPICalculator):
 class AccessReviewStatusCalculator(KPICalculator):
     """Calculates periodic access review status KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "access_reviews"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count accounts overdue for access review."""
         try:
-            app_data = data[data["app_id"] == app_id].copy()
-
             overdue_count = 0
             if "last_review_date" in app_data.columns:
-                # Convert to datetime
-                app_data["last_review_date"] = pd.to_datetime(app_data["last_review_date"], errors='coerce')
+                review_dates = _as_datetime(app_data["last_review_date"])
                 
                 # Consider reviews overdue if older than 90 days
                 cutoff_date = self.clock.now() - timedelta(days=90)
                 
-                # Count active accounts with overdue reviews
-                if "status" in app_data.columns:
-                    overdue_accounts = app_data[
-                        (app_data["status"] == "active") &
-                        (app_data["last_review_date"].notna()) &
-                        (app_data["last_review_date"] < cutoff_date)
-                    ]
-                else:
-                    # Fallback: just check review date
-                    overdue_accounts = app_data[
-                        (app_data["last_review_date"].notna()) &
-                        (app_data["last_review_date"] < cutoff_date)
-                    ]
-                
-                overdue_count = len(overdue_accounts)
+                # Count active accounts (all, if status is missing) with overdue reviews
+                overdue_count = _count_all(_active(app_data), _before(review_dates, cutoff_date))
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="access_reviews",
                 value=float(overdue_count),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute access_reviews: {str(e)}",
@@ -221,49 +343,44 @@ class AccessReviewStatusCalculator(KPICalculator):
 class PolicyViolationsCalculator(KPICalculator):
     """Calculates policy violations KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "policy_violations"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count policy violations based on various rules."""
         try:
-            app_data = data[data["app_id"] == app_id].copy()
-
             violation_count = 0
             
             # Rule 1: Users with excessive failed attempts (>10)
             if "failed_attempts" in app_data.columns:
-                excessive_failures = len(app_data[app_data["failed_attempts"] > 10])
+                excessive_failures = _count_all(app_data["failed_attempts"] > 10)
                 violation_count += excessive_failures
             
             # Rule 2: Privileged accounts without recent review
             if "is_privileged" in app_data.columns and "last_review_date" in app_data.columns:
-                app_data["last_review_date"] = pd.to_datetime(app_data["last_review_date"], errors='coerce')
+                review_dates = _as_datetime(app_data["last_review_date"])
                 cutoff_date = self.clock.now() - timedelta(days=30)
                 
-                privileged_without_review = len(app_data[
-                    (app_data["is_privileged"] == True) &
-                    (app_data["last_review_date"].notna()) &
-                    (app_data["last_review_date"] < cutoff_date)
-                ])
+                privileged_without_review = _count_all(
+                    _flag(app_data["is_privileged"]),
+                    _before(review_dates, cutoff_date)
+                )
                 violation_count += privileged_without_review
             
             # Rule 3: Active accounts with exit dates (orphan accounts)
             if "status" in app_data.columns and "exit_date" in app_data.columns:
-                orphan_accounts = len(app_data[
-                    (app_data["status"] == "active") &
-                    (app_data["exit_date"].notna()) &
-                    (app_data["exit_date"] != "")
-                ])
+                orphan_accounts = _count_all(
+                    _active(app_data),
+                    _has_value(app_data["exit_date"])
+                )
                 violation_count += orphan_accounts
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="policy_violations",
                 value=float(violation_count),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute policy_violations: {str(e)}",
@@ -274,25 +391,24 @@ class PolicyViolationsCalculator(KPICalculator):
 class ExcessivePermissionsCalculator(KPICalculator):
     """Calculates excessive permissions KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "excessive_permissions"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count users with excessive permissions."""
         try:
-            app_data = data[data["app_id"] == app_id].copy()
-
             excessive_count = 0
             
             # Rule 1: Count privileged users in non-production apps
             if "is_privileged" in app_data.columns and "environment" in app_data.columns:
-                privileged_in_non_prod = len(app_data[
-                    (app_data["is_privileged"] == True) &
-                    (~app_data["environment"].isin(["PROD", "PRODUCTION"]))
-                ])
+                privileged_in_non_prod = _count_all(
+                    _flag(app_data["is_privileged"]),
+                    ~_isin(app_data["environment"], _PROD_ENVIRONMENTS)
+                )
                 excessive_count += privileged_in_non_prod
             
             # Rule 2: Count users with multiple high-level roles
             if "role" in app_data.columns and "user_id" in app_data.columns:
-                high_privilege_roles = ["ADMIN", "SUPERUSER", "ROOT", "DBA"]
-                users_with_high_roles = app_data[app_data["role"].isin(high_privilege_roles)]
+                users_with_high_roles = app_data[_isin(app_data["role"], _HIGH_PRIVILEGE_ROLES)]
                 
                 # Count users appearing multiple times with high privilege roles
                 role_counts = users_with_high_roles.groupby("user_id")["role"].count()
@@ -301,22 +417,19 @@ class ExcessivePermissionsCalculator(KPICalculator):
             
             # Rule 3: Count privileged accounts without justification
             if "is_privileged" in app_data.columns and "justification" in app_data.columns:
-                privileged_without_justification = len(app_data[
-                    (app_data["is_privileged"] == True) &
-                    ((app_data["justification"].isna()) | (app_data["justification"] == ""))
-                ])
+                privileged_without_justification = _count_all(
+                    _flag(app_data["is_privileged"]),
+                    ~_has_value(app_data["justification"])
+                )
                 excessive_count += privileged_without_justification
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="excessive_permissions",
                 value=float(excessive_count),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute excessive_permissions: {str(e)}",
@@ -327,63 +440,335 @@ class ExcessivePermissionsCalculator(KPICalculator):
 class DormantAccountsCalculator(KPICalculator):
     """Calculates dormant accounts KPI."""
 
-    def compute(self, data: pd.DataFrame, app_id: str) -> KPIRecord:
+    kpi_name = "dormant_accounts"
+
+    def measure(self, app_data: pd.DataFrame, app_id: str) -> KPIRecord:
         """Count accounts that have been inactive for too long."""
         try:
-            app_data = data[data["app_id"] == app_id].copy()
-
             dormant_count = 0
             
             # Rule 1: Accounts with no recent login (older than 90 days)
             if "last_login_date" in app_data.columns:
-                app_data["last_login_date"] = pd.to_datetime(app_data["last_login_date"], errors='coerce')
+                login_dates = _as_datetime(app_data["last_login_date"])
                 cutoff_date = self.clock.now() - timedelta(days=90)
                 
-                if "status" in app_data.columns:
-                    dormant_accounts = app_data[
-                        (app_data["status"] == "active") &
-                        (app_data["last_login_date"].notna()) &
-                        (app_data["last_login_date"] < cutoff_date)
-                    ]
-                else:
-                    # Fallback: just check login date
-                    dormant_accounts = app_data[
-                        (app_data["last_login_date"].notna()) &
-                        (app_data["last_login_date"] < cutoff_date)
-                    ]
-                
-                dormant_count += len(dormant_accounts)
+                # Active accounts (all, if status is missing) with a stale login
+                dormant_count += _count_all(_active(app_data), _before(login_dates, cutoff_date))
             
             # Rule 2: Accounts created but never logged in
             if "account_created_date" in app_data.columns and "last_login_date" in app_data.columns:
-                app_data["account_created_date"] = pd.to_datetime(app_data["account_created_date"], errors='coerce')
-                app_data["last_login_date"] = pd.to_datetime(app_data["last_login_date"], errors='coerce')
-                
-                never_logged_in = app_data[
-                    (app_data["account_created_date"].notna()) &
-                    (app_data["last_login_date"].isna())
-                ]
+                created_dates = _as_datetime(app_data["account_created_date"])
+                login_dates = _as_datetime(app_data["last_login_date"])
                 
                 # Only count if created more than 7 days ago
                 creation_cutoff = self.clock.now() - timedelta(days=7)
-                never_logged_in_old = never_logged_in[
-                    never_logged_in["account_created_date"] < creation_cutoff
-                ]
-                
-                dormant_count += len(never_logged_in_old)
+                dormant_count += _count_all(
+                    login_dates.isna(),
+                    _before(created_dates, creation_cutoff)
+                )
 
-            kpi = KPIRecord(
+            return KPIRecord(
                 app_id=app_id,
                 kpi_name="dormant_accounts",
                 value=float(dormant_count),
                 computed_at=self.clock.now()
             )
 
-            self.storage.persist_kpi(kpi)
-            return kpi
-
         except Exception as e:
             raise ProcessingError(
                 message=f"Failed to compute dormant_accounts: {str(e)}",
                 context={"app_id": app_id}
-            )
\ No newline at end of file
+            )
+
+
+class KPIAggregator:
+    """
+    Base class for whole-frame KPI aggregators.
+
+    Unlike KPICalculator, an aggregator is not per-app: compute_all()
+    returns (and persists) every KPI in kpi_names for every app in a frame.
+    """
+
+    kpi_names: Tuple[str, ...] = ()
+
+    def __init__(self, storage: Storage, clock: Clock):
+        self.storage = storage
+        self.clock = clock
+
+    def compute_all(self, data: pd.DataFrame) -> List[KPIRecord]:
+        """Compute and persist this aggregator's KPIs for all apps in data."""
+        raise NotImplementedError
+
+
+class CountKPIAggregator(KPIAggregator):
+    """
+    Computes the count-style KPIs for every app in one groupby aggregation.
+
+    Produces orphan_accounts, privileged_accounts and failed_access_attempts
+    with the same column fallbacks as the per-app calculators, but flags all
+    rows once and sums per app in a single pass over the frame.
+    """
+
+    kpi_names = ("orphan_accounts", "privileged_accounts", "failed_access_attempts")
+
+    def compute_all(self, data: pd.DataFrame) -> List[KPIRecord]:
+        """Compute count KPIs for all apps present in data."""
+        return self.compute_streaming([data])
+
+    def compute_streaming(self, chunks: Iterable[pd.DataFrame]) -> List[KPIRecord]:
+        """
+        Compute count KPIs over CSV chunks with running per-app totals.
+
+        Only the identifier columns are retained between chunks, since
+        orphan detection needs every user of an app before it can decide.
+        """
+        try:
+            totals: Optional[pd.DataFrame] = None
+            id_frames = []
+            for chunk in chunks:
+                counts = self._count_chunk(chunk)
+                totals = counts if totals is None else totals.add(counts, fill_value=0)
+                id_frames.append(chunk[[c for c in _ID_COLUMNS if c in chunk.columns]])
+
+            if totals is None:
+                return []
+
+            ids = pd.concat(id_frames, ignore_index=True)
+            totals["orphan_accounts"] = self._count_orphans(ids).reindex(totals.index, fill_value=0)
+
+            computed_at = self.clock.now()
+            kpis = [
+                KPIRecord(
+                    app_id=str(app_id),
+                    kpi_name=kpi_name,
+                    value=float(value),
+                    computed_at=computed_at
+                )
+                for app_id, row in zip(totals.index, totals[list(self.kpi_names)].itertuples(index=False))
+                for kpi_name, value in zip(self.kpi_names, row)
+            ]
+            self.storage.persist_kpis(kpis)
+            return kpis
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute count KPIs: {str(e)}",
+                context={"kpis": ",".join(self.kpi_names)}
+            )
+
+    def _count_chunk(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Sum the row-local KPI flags per app for one chunk."""
+        columns = data.columns
+        flags = pd.DataFrame({"app_id": data["app_id"]}, index=data.index)
+
+        if "is_privileged" in columns:
+            flags["privileged_accounts"] = _flag(data["is_privileged"])
+        elif "role" in columns:
+            flags["privileged_accounts"] = _isin(data["role"], _PRIVILEGED_ROLES)
+        else:
+            flags["privileged_accounts"] = False
+
+        if "failed_attempts" in columns:
+            flags["failed_access_attempts"] = data["failed_attempts"]
+        elif "access_result" in columns:
+            flags["failed_access_attempts"] = data["access_result"] == "FAILED"
+        else:
+            flags["failed_access_attempts"] = 0
+
+        return flags.groupby("app_id", sort=False, observed=True).sum()
+
+    def _count_orphans(self, ids: pd.DataFrame) -> pd.Series:
+        """Count orphans per app: managers not among the same app's users."""
+        if "manager_id" not in ids.columns:
+            return pd.Series(0, index=pd.Index(ids["app_id"].unique()))
+
+        # Only rows with a manager can be orphans
+        managed = ids[ids["manager_id"].notna()]
+        if "user_id" in ids.columns:
+            # One hash table of distinct (app_id, user_id) pairs for all apps
+            users = pd.MultiIndex.from_frame(
+                ids[["app_id", "user_id"]].dropna().drop_duplicates()
+            )
+            managers = pd.MultiIndex.from_arrays([managed["app_id"], managed["manager_id"]])
+            orphan = ~managers.isin(users)
+        else:
+            orphan = np.ones(len(managed), dtype=bool)
+        return pd.Series(orphan, index=managed.index).groupby(managed["app_id"], sort=False, observed=True).sum()
+
+
+class RowKPIAggregator(KPIAggregator):
+    """
+    Computes the review, policy and dormancy KPIs for every app in one
+    groupby aggregation.
+
+    Every rule of AccessReviewStatusCalculator, PolicyViolationsCalculator
+    and DormantAccountsCalculator flags individual rows, so the flags are
+    built once over the whole frame and summed per app.
+    """
+
+    kpi_names = ("access_reviews", "policy_violations", "dormant_accounts")
+
+    def compute_all(self, data: pd.DataFrame) -> List[KPIRecord]:
+        """Compute row-flag KPIs for all apps present in data."""
+        try:
+            now = self.clock.now()
+            columns = data.columns
+            active = _active(data)
+            zeros = np.zeros(len(data), dtype=np.int64)
+
+            access_reviews = zeros
+            if "last_review_date" in columns:
+                review_dates = _as_datetime(data["last_review_date"])
+                access_reviews = _all(active, _before(review_dates, now - timedelta(days=90)))
+
+            policy_violations = zeros
+            if "failed_attempts" in columns:
+                policy_violations = policy_violations + _mask(data["failed_attempts"] > 10)
+            if "is_privileged" in columns and "last_review_date" in columns:
+                policy_violations = policy_violations + _all(
+                    _flag(data["is_privileged"]),
+                    _before(_as_datetime(data["last_review_date"]), now - timedelta(days=30))
+                )
+            if "status" in columns and "exit_date" in columns:
+                policy_violations = policy_violations + _all(active, _has_value(data["exit_date"]))
+
+            dormant_accounts = zeros
+            if "last_login_date" in columns:
+                login_dates = _as_datetime(data["last_login_date"])
+                dormant_accounts = dormant_accounts + _all(
+                    active, _before(login_dates, now - timedelta(days=90))
+                )
+                if "account_created_date" in columns:
+                    dormant_accounts = dormant_accounts + _all(
+                        login_dates.isna(),
+                        _before(_as_datetime(data["account_created_date"]), now - timedelta(days=7))
+                    )
+
+            totals = pd.DataFrame(
+                {
+                    "access_reviews": access_reviews,
+                    "policy_violations": policy_violations,
+                    "dormant_accounts": dormant_accounts,
+                },
+                index=data.index
+            ).groupby(data["app_id"], sort=False, observed=True).sum()
+
+            kpis = [
+                KPIRecord(
+                    app_id=str(app_id),
+                    kpi_name=kpi_name,
+                    value=float(value),
+                    computed_at=now
+                )
+                for app_id, row in zip(totals.index, totals[list(self.kpi_names)].itertuples(index=False))
+                for kpi_name, value in zip(self.kpi_names, row)
+            ]
+            self.storage.persist_kpis(kpis)
+            return kpis
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute row KPIs: {str(e)}",
+                context={"kpis": ",".join(self.kpi_names)}
+            )
+
+
+class GroupKPIAggregator(KPIAggregator):
+    """
+    Computes provisioning time and excessive permissions for every app in
+    one pass over the frame.
+
+    Apps are factorized to integer codes once; per-app sums, counts and
+    means are then np.bincount reductions over those codes instead of one
+    calculator call per app.
+    """
+
+    kpi_names = ("access_provisioning_time", "excessive_permissions")
+
+    def compute_all(self, data: pd.DataFrame) -> List[KPIRecord]:
+        """Compute group-statistic KPIs for all apps present in data."""
+        try:
+            codes, app_ids = pd.factorize(data["app_id"], sort=False)
+            n_apps = len(app_ids)
+            # Rows without an app_id (code -1) belong to no app
+            in_app = codes >= 0
+
+            totals = {
+                "access_provisioning_time": self._provisioning_days(data, codes, in_app, n_apps),
+                "excessive_permissions": self._excessive_permissions(data, codes, in_app, n_apps),
+            }
+
+            computed_at = self.clock.now()
+            kpis = [
+                KPIRecord(
+                    app_id=str(app_id),
+                    kpi_name=kpi_name,
+                    value=float(totals[kpi_name][position]),
+                    computed_at=computed_at
+                )
+                for position, app_id in enumerate(app_ids)
+                for kpi_name in self.kpi_names
+            ]
+            self.storage.persist_kpis(kpis)
+            return kpis
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Failed to compute group KPIs: {str(e)}",
+                context={"kpis": ",".join(self.kpi_names)}
+            )
+
+    def _provisioning_days(
+        self, data: pd.DataFrame, codes: np.ndarray, in_app: np.ndarray, n_apps: int
+    ) -> np.ndarray:
+        """Mean whole days from request to grant per app (0 when none)."""
+        if "access_request_date" not in data.columns or "access_granted_date" not in data.columns:
+            return np.zeros(n_apps)
+
+        requested = _as_datetime(data["access_request_date"]).to_numpy(dtype="datetime64[ns]").view("i8")
+        granted = _as_datetime(data["access_granted_date"]).to_numpy(dtype="datetime64[ns]").view("i8")
+        valid = in_app & (requested != _NAT) & (granted != _NAT)
+
+        days = (granted[valid] - requested[valid]) // _NS_PER_DAY
+        keep = days >= 0
+        app_codes = codes[valid][keep]
+        sums = np.bincount(app_codes, weights=days[keep], minlength=n_apps)
+        counts = np.bincount(app_codes, minlength=n_apps)
+        return np.divide(sums, counts, out=np.zeros(n_apps), where=counts > 0)
+
+    def _excessive_permissions(
+        self, data: pd.DataFrame, codes: np.ndarray, in_app: np.ndarray, n_apps: int
+    ) -> np.ndarray:
+        """Excessive-permission rule hits per app."""
+        columns = data.columns
+        total = np.zeros(n_apps, dtype=np.int64)
+
+        # Rule 1: privileged users in non-production environments
+        if "is_privileged" in columns and "environment" in columns:
+            rows = _all(
+                in_app,
+                _flag(data["is_privileged"]),
+                ~_isin(data["environment"], _PROD_ENVIRONMENTS)
+            )
+            total += np.bincount(codes[rows], minlength=n_apps)
+
+        # Rule 2: users holding more than one high-privilege role row
+        if "role" in columns and "user_id" in columns:
+            rows = _all(in_app, _isin(data["role"], _HIGH_PRIVILEGE_ROLES))
+            pairs = pd.DataFrame(
+                {"code": codes[rows], "user_id": data["user_id"].to_numpy()[rows]}
+            ).dropna()
+            sizes = pairs.groupby(["code", "user_id"], sort=False).size()
+            repeated = sizes[sizes > 1].index.get_level_values("code").to_numpy(dtype=np.int64)
+            total += np.bincount(repeated, minlength=n_apps)
+
+        # Rule 3: privileged accounts without justification
+        if "is_privileged" in columns and "justification" in columns:
+            rows = _all(
+                in_app,
+                _flag(data["is_privileged"]),
+                ~_has_value(data["justification"])
+            )
+            total += np.bincount(codes[rows], minlength=n_apps)
+
+        return total
@@ -2,12 +2,26 @@
 Policy Rule Engine for violation detection.
 """
 
-from uuid import uuid4
-from typing import List
-from ...interfaces.dto import Violation, Severity
+import os
+import numpy as np
+from uuid import UUID
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from ...interfaces.dto import Violation, ViolationState, Severity
 from ...interfaces.ports import Storage, Clock
 from ...interfaces.errors import ProcessingError
 
+# Severity by number of threshold levels reached
+_SEVERITY_TABLE = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
+_LEVELS = ("medium", "high", "critical")
+
+
+def _uuid4_batch(n: int) -> List[str]:
+    """Mint n random (version 4) UUID strings from a single urandom call."""
+    raw = os.urandom(16 * n)
+    # UUID(version=4) sets the version and RFC 4122 variant bits
+    return [str(UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
 
 class PolicyRuleEngine:
     """
@@ -22,6 +36,7 @@ class PolicyRuleEngine:
         self.storage = storage
         self.clock = clock
         self.thresholds = thresholds
+        self._cutoffs: Dict[str, np.ndarray] = {}
 
     def evaluate(self, app_id: str, kpi_values: dict) -> List[Violation]:
         """
@@ -30,29 +45,10 @@ class PolicyRuleEngine:
         Returns list of detected violations.
         """
         try:
-            violations = []
-
-            for kpi_name, value in kpi_values.items():
-                thresholds = self.thresholds.get(kpi_name, {})
-
-                # Determine severity
-                severity = self._determine_severity(value, thresholds)
-
-                if severity != Severity.LOW:  # Ignore LOW severity
-                    violation = Violation(
-                        violation_id=str(uuid4()),
-                        app_id=app_id,
-                        rule_id=f"threshold_{kpi_name}",
-                        severity=severity,
-                        kpi_values={kpi_name: value},
-                        threshold_breached=thresholds,
-                        evidence={"kpi_value": str(value)},
-                        detected_at=self.clock.now(),
-                        state="NEW"
-                    )
-                    self.storage.persist_violation(violation)
-                    violations.append(violation)
-
+            violations = self._detect(
+                [(app_id, kpi_name, value) for kpi_name, value in kpi_values.items()]
+            )
+            self.storage.persist_violations(violations)
             return violations
 
         except Exception as e:
@@ -61,13 +57,82 @@ class PolicyRuleEngine:
                 context={"app_id": app_id}
             )
 
-    def _determine_severity(self, value: float, thresholds: dict) -> Severity:
-        """Determine severity based on value vs thresholds."""
-        if value >= thresholds.get("critical", float("inf")):
-            return Severity.CRITICAL
-        elif value >= thresholds.get("high", float("inf")):
-            return Severity.HIGH
-        elif value >= thresholds.get("medium", float("inf")):
-            return Severity.MEDIUM
-        else:
-            return Severity.LOW
+    def evaluate_batch(self, rows: Iterable[Tuple[str, str, float]]) -> List[Violation]:
+        """
+        Evaluate many (app_id, kpi_name, value) rows in one vectorized pass.
+
+        Returns detected violations in row order, persisted in one call.
+        """
+        try:
+            violations = self._detect(list(rows))
+            self.storage.persist_violations(violations)
+            return violations
+
+        except Exception as e:
+            raise ProcessingError(
+                message=f"Policy evaluation failed: {str(e)}",
+                context={"mode": "batch"}
+            )
+
+    def _detect(self, rows: List[Tuple[str, str, float]]) -> List[Violation]:
+        """Classify rows per KPI with searchsorted and build violations."""
+        positions_by_kpi: Dict[str, List[int]] = {}
+        for position, (_, kpi_name, _) in enumerate(rows):
+            positions_by_kpi.setdefault(kpi_name, []).append(position)
+
+        levels = [0] * len(rows)
+        for kpi_name, positions in positions_by_kpi.items():
+            values = np.array([rows[p][2] for p in positions], dtype=float)
+            for position, level in zip(positions, self._severity_levels(kpi_name, values)):
+                levels[position] = level
+
+        # Ignore LOW severity
+        breaches = [(row, level) for row, level in zip(rows, levels) if level > 0]
+        violation_ids = _uuid4_batch(len(breaches))
+        detected_at = self.clock.now()
+        return [
+            self._build_violation(
+                violation_id, app_id, kpi_name, value, _SEVERITY_TABLE[level], detected_at
+            )
+            for violation_id, ((app_id, kpi_name, value), level) in zip(violation_ids, breaches)
+        ]
+
+    def _severity_levels(self, kpi_name: str, values: np.ndarray) -> np.ndarray:
+        """Map values to indices into _SEVERITY_TABLE in one call."""
+        levels = np.searchsorted(self._cutoffs_for(kpi_name), values, side="right")
+        # NaN sorts past every cutoff but never meets a threshold
+        return np.where(np.isnan(values), 0, levels)
+
+    def _cutoffs_for(self, kpi_name: str) -> np.ndarray:
+        """Sorted per-KPI cutoffs for medium/high/critical (inf when unset)."""
+        cutoffs = self._cutoffs.get(kpi_name)
+        if cutoffs is None:
+            thresholds = self.thresholds.get(kpi_name, {})
+            raw = np.array([thresholds.get(level, np.inf) for level in _LEVELS], dtype=float)
+            # A level is reached by meeting its own or any higher threshold,
+            # which keeps the array sorted even for inconsistent configs
+            cutoffs = np.minimum.accumulate(raw[::-1])[::-1]
+            self._cutoffs[kpi_name] = cutoffs
+        return cutoffs
+
+    def _build_violation(
+        self,
+        violation_id: str,
+        app_id: str,
+        kpi_name: str,
+        value: float,
+        severity: Severity,
+        detected_at: datetime
+    ) -> Violation:
+        """Build violation DTO for a breached threshold."""
+        return Violation(
+            violation_id=violation_id,
+            app_id=app_id,
+            rule_id=f"threshold_{kpi_name}",
+            severity=severity,
+            kpi_values={kpi_name: value},
+            threshold_breached=self.thresholds.get(kpi_name, {}),
+            evidence={"kpi_value": str(value)},
+            detected_at=detected_at,
+            state=ViolationState.NEW
+        )
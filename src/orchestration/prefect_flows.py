@@ -4,10 +4,20 @@ Prefect workflow orchestration for UAM Compliance System.
 Provides automated, scheduled, and monitored execution of compliance workflows.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+import pandas as pd
 import prefect
 from prefect import flow, task, get_run_logger
 from prefect.deployments import Deployment
@@ -16,6 +26,21 @@ from prefect.schedules import CronSchedule
 from ..composition_root import ServiceContainer
 from ..interfaces.dto import KPIRecord, Violation, Alert
 from ..interfaces.errors import ProcessingError, ConfigurationError
+from .scheduler import encode_report
+
+
+# Files processed concurrently per flow run (bounds storage/notification load)
+MAX_PARALLEL_FILES = 4
+
+
+# Daily compliance check at 2 AM UTC (cron parsed once at import)
+DAILY_2AM_SCHEDULE = CronSchedule(cron="0 2 * * *")
+
+
+# Report aggregates, the store they were built from and how many of its
+# records of each kind were read, carried between report runs (JSON, so
+# loading it never executes code)
+REPORT_STATE_PATH = Path("reports/.cache.json")
 
 
 # Configure Prefect
@@ -27,6 +52,43 @@ prefect.settings.update(
 )
 
 
+def _config_mtime_ns(config_path: str) -> int:
+    """Latest modification time (ns) of the files in the config directory."""
+    with os.scandir(config_path) as entries:
+        return max(
+            (entry.stat().st_mtime_ns for entry in entries if entry.is_file()),
+            default=0
+        )
+
+
+# config_path -> (config_mtime_ns, container) reused across flow runs
+_containers: Dict[str, Tuple[int, ServiceContainer]] = {}
+_containers_lock = threading.Lock()
+
+
+def _production_container(config_path: str, config_mtime_ns: int) -> ServiceContainer:
+    """
+    Build and warm up a production container, reused across flow runs.
+    
+    Editing any config file (a new config_mtime_ns) yields a fresh
+    container on the next run; the one it replaces is closed.
+    """
+    with _containers_lock:
+        cached = _containers.get(config_path)
+        if cached is not None and cached[0] == config_mtime_ns:
+            return cached[1]
+        container = ServiceContainer.production(config_path)
+        
+        # Initialize pipeline services in the background so the first
+        # process_csv_file task does not pay their first-use cost
+        container.warmup()
+        _containers[config_path] = (config_mtime_ns, container)
+    
+    if cached is not None:
+        cached[1].close()
+    return container
+
+
 @task(
     name="Load Configuration",
     retries=3,
@@ -47,11 +109,11 @@ async def load_configuration(config_path: str = "config") -> Dict[str, Any]:
     logger.info("Loading system configuration")
     
     try:
-        # Initialize production services
-        container = ServiceContainer.create_production(config_path)
+        # Initialize production services (cached until config files change)
+        container = _production_container(config_path, _config_mtime_ns(config_path))
         
-        # Validate configuration
-        config = container.get_config()
+        # Validated by ServiceContainer.production()
+        config = container.config
         logger.info(f"Configuration loaded successfully for {len(config.thresholds.alert_thresholds)} KPIs")
         
         return {
@@ -86,19 +148,20 @@ async def discover_data_files(data_dir: str = "data/incoming") -> List[str]:
     logger.info(f"Discovering data files in {data_dir}")
     
     try:
-        data_path = Path(data_dir)
-        if not data_path.exists():
+        # Find CSV files modified in last 24 hours in a single directory scan
+        cutoff = time.time() - 24 * 3600.0
+        try:
+            with os.scandir(data_dir) as entries:
+                csv_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".csv")
+                    and entry.is_file(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime > cutoff
+                ]
+        except FileNotFoundError:
             logger.warning(f"Data directory {data_dir} does not exist")
             return []
         
-        # Find CSV files modified in last 24 hours
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        csv_files = []
-        
-        for file_path in data_path.glob("*.csv"):
-            if file_path.stat().st_mtime > cutoff_time.timestamp():
-                csv_files.append(str(file_path))
-        
         logger.info(f"Found {len(csv_files)} files for processing")
         return csv_files
         
@@ -110,16 +173,91 @@ async def discover_data_files(data_dir: str = "data/incoming") -> List[str]:
         )
 
 
+def _compute_kpis(data: pd.DataFrame, container: ServiceContainer, logger) -> List[KPIRecord]:
+    """Compute and persist every KPI for every app in a parsed file."""
+    # The whole-frame aggregators cover every KPI, each computed for all
+    # apps at once and persisted by the aggregator
+    kpis = []
+    for aggregator in (
+        container.count_kpi_aggregator(),
+        container.row_kpi_aggregator(),
+        container.group_kpi_aggregator()
+    ):
+        try:
+            kpis.extend(aggregator.compute_all(data))
+        except Exception as e:
+            logger.warning(f"KPI aggregation failed: {str(e)}")
+    return kpis
+
+
 @task(
-    name="Process CSV File",
+    name="Parse CSV File",
     retries=3,
     retry_delay_seconds=60,
     timeout_seconds=1800  # 30 minutes
 )
+async def parse_csv_task(file_path: str, services: Dict[str, Any]) -> pd.DataFrame:
+    """Parse one CSV file in a worker thread."""
+    logger = get_run_logger()
+    data, _ = await asyncio.to_thread(services["container"].csv_parser().parse, file_path)
+    logger.info(f"Parsed {len(data)} records from {file_path}")
+    return data
+
+
+@task(
+    name="Compute KPIs",
+    timeout_seconds=1800  # 30 minutes
+)
+async def compute_kpis_task(data: pd.DataFrame, services: Dict[str, Any]) -> List[KPIRecord]:
+    """Compute and persist KPIs for a parsed file in a worker thread."""
+    logger = get_run_logger()
+    kpis = await asyncio.to_thread(_compute_kpis, data, services["container"], logger)
+    logger.info(f"Computed {len(kpis)} KPIs")
+    return kpis
+
+
+@task(name="Evaluate Policies")
+async def evaluate_policies_task(kpis: List[KPIRecord],
+                                 services: Dict[str, Any]) -> List[Violation]:
+    """Evaluate every KPI in one batch (violations persisted once)."""
+    logger = get_run_logger()
+    try:
+        violations = await asyncio.to_thread(
+            services["container"].policy_engine().evaluate_batch,
+            [(kpi.app_id, kpi.kpi_name, kpi.value) for kpi in kpis]
+        )
+    except Exception as e:
+        logger.warning(f"Policy evaluation failed: {str(e)}")
+        return []
+    logger.info(f"Found {len(violations)} violations")
+    return violations
+
+
+@task(name="Send Alerts")
+async def notify_task(violations: List[Violation], services: Dict[str, Any]) -> List[Alert]:
+    """Generate, persist and dispatch alerts for violations."""
+    logger = get_run_logger()
+    if not violations:
+        return []
+    try:
+        alerts = await asyncio.to_thread(
+            services["container"].alert_generator().generate_batch, violations
+        )
+    except Exception as e:
+        logger.error(f"Alert generation failed: {str(e)}")
+        return []
+    logger.info(f"Generated {len(alerts)} alerts")
+    return alerts
+
+
 async def process_csv_file(file_path: str, services: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process a single CSV file through the complete pipeline.
     
+    Each stage is its own task, so stages are retried and reported
+    individually; with the flow running files concurrently, one file's
+    notifications overlap the next file's parsing.
+    
     Args:
         file_path: Path to CSV file
         services: Service container and configuration
@@ -133,60 +271,10 @@ async def process_csv_file(file_path: str, services: Dict[str, Any]) -> Dict[str
     try:
         container = services["container"]
         
-        # Parse CSV data
-        logger.info("Parsing CSV data")
-        data = container.csv_parser.parse(file_path)
-        logger.info(f"Parsed {len(data)} records from {file_path}")
-        
-        # Compute KPIs
-        logger.info("Computing KPIs")
-        kpis = []
-        for app_id in data['app_id'].unique():
-            app_data = data[data['app_id'] == app_id]
-            for calculator in container.kpi_calculators:
-                try:
-                    kpi = calculator.compute(app_data)
-                    if kpi:
-                        kpis.append(kpi)
-                        container.storage.save_kpi(kpi)
-                except Exception as e:
-                    logger.warning(f"KPI calculation failed for {app_id}: {str(e)}")
-        
-        logger.info(f"Computed {len(kpis)} KPIs")
-        
-        # Evaluate policies
-        logger.info("Evaluating policies")
-        violations = []
-        for kpi in kpis:
-            try:
-                violation = container.policy_engine.evaluate(kpi)
-                if violation:
-                    violations.append(violation)
-                    container.storage.save_violation(violation)
-            except Exception as e:
-                logger.warning(f"Policy evaluation failed for {kpi.app_id}: {str(e)}")
-        
-        logger.info(f"Found {len(violations)} violations")
-        
-        # Generate alerts if violations exist
-        alerts = []
-        if violations:
-            logger.info("Generating alerts")
-            try:
-                alert = container.alert_generator.create_alert(violations)
-                if alert:
-                    alerts.append(alert)
-                    container.storage.save_alert(alert)
-                    
-                    # Send notifications
-                    logger.info("Sending notifications")
-                    container.slack_adapter.send_alert(alert)
-                    container.email_adapter.send_alert(alert)
-                    
-            except Exception as e:
-                logger.error(f"Alert generation failed: {str(e)}")
-        
-        logger.info(f"Generated {len(alerts)} alerts")
+        data = await parse_csv_task(file_path, services)
+        kpis = await compute_kpis_task(data, services)
+        violations = await evaluate_policies_task(kpis, services)
+        alerts = await notify_task(violations, services)
         
         # Log completion
         container.audit_logger.log_data_access(
@@ -227,17 +315,83 @@ async def process_csv_file(file_path: str, services: Dict[str, Any]) -> Dict[str
         }
 
 
+def _empty_report_state(storage_id: str) -> Dict[str, Any]:
+    """Aggregates for a report built from no records of the given store."""
+    return {
+        "storage": storage_id,
+        "extents": {},
+        "offsets": {"kpis": 0, "violations": 0, "alerts": 0},
+        "app_ids": set(),
+        "total_kpis": 0,
+        "total_violations": 0,
+        "total_alerts": 0,
+        "violations_by_severity": Counter(),
+        "app_violations": Counter(),
+    }
+
+
+def _is_rewritten(cached: Dict[str, Any], current: Dict[str, Any]) -> bool:
+    """True if any record stream was replaced or shrank since it was cached."""
+    for kind, (generation, size) in current.items():
+        if kind in cached:
+            cached_generation, cached_size = cached[kind]
+            if cached_generation != generation or size < cached_size:
+                return True
+    return False
+
+
+def _load_report_state(rebuild: bool, storage_id: str,
+                       extents: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cached report aggregates, or empty ones for a full rebuild.
+
+    A cache built from a different store, or from streams that have since
+    been rotated or truncated, is discarded rather than reused.
+    """
+    if rebuild:
+        return _empty_report_state(storage_id)
+    try:
+        with open(REPORT_STATE_PATH, "r") as f:
+            cached = json.load(f)
+        if cached.get("storage") != storage_id or _is_rewritten(cached["extents"], extents):
+            return _empty_report_state(storage_id)
+        return {
+            **cached,
+            "app_ids": set(cached["app_ids"]),
+            "violations_by_severity": Counter(cached["violations_by_severity"]),
+            "app_violations": Counter(cached["app_violations"]),
+        }
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        # Missing or malformed cache: rebuild from all records
+        return _empty_report_state(storage_id)
+
+
+def _save_report_state(state: Dict[str, Any]) -> None:
+    """Atomically replace the cached report aggregates."""
+    REPORT_STATE_PATH.parent.mkdir(exist_ok=True)
+    tmp_path = REPORT_STATE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({**state, "app_ids": sorted(state["app_ids"])}, f)
+    os.replace(tmp_path, REPORT_STATE_PATH)
+
+
 @task(
     name="Generate Compliance Report",
     retries=2,
     retry_delay_seconds=30
 )
-async def generate_compliance_report(services: Dict[str, Any]) -> Dict[str, Any]:
+async def generate_compliance_report(services: Dict[str, Any],
+                                     rebuild: bool = False) -> Dict[str, Any]:
     """
     Generate daily compliance report.
     
+    Only records persisted since the previous report are loaded, by
+    skipping the number already read from the same store; they are
+    folded into aggregates cached at REPORT_STATE_PATH.
+    
     Args:
         services: Service container and configuration
+        rebuild: Ignore cached aggregates and recompute from all records
         
     Returns:
         Compliance report summary
@@ -248,45 +402,48 @@ async def generate_compliance_report(services: Dict[str, Any]) -> Dict[str, Any]
     try:
         container = services["container"]
         
-        # Load recent data
-        kpis = container.storage.load_kpis()
-        violations = container.storage.load_violations()
-        alerts = container.storage.load_alerts()
+        # Load only records persisted after those the previous report read
+        storage = container.storage
+        # Taken before loading: records appended meanwhile only grow sizes
+        extents = storage.extents()
+        state = _load_report_state(rebuild, storage.identity(), extents)
+        state["extents"] = extents
+        offsets = state["offsets"]
+        kpis = storage.load_kpis(start=offsets["kpis"])
+        violations = storage.load_violations(start=offsets["violations"])
+        alerts = storage.load_alerts(start=offsets["alerts"])
+        
+        # Fold the deltas into the cached aggregates
+        state["app_ids"].update(kpi.app_id for kpi in kpis)
+        state["total_kpis"] += len(kpis)
+        state["total_violations"] += len(violations)
+        state["total_alerts"] += len(alerts)
+        # Counter.update tallies in C; top apps are selected with a heap
+        state["violations_by_severity"].update(v.severity.value for v in violations)
+        state["app_violations"].update(v.app_id for v in violations)
+        offsets["kpis"] += len(kpis)
+        offsets["violations"] += len(violations)
+        offsets["alerts"] += len(alerts)
+        
+        severity_counts = state["violations_by_severity"]
         
         # Generate summary statistics
         report = {
             "generated_at": datetime.now().isoformat(),
             "summary": {
-                "total_applications": len(set(kpi.app_id for kpi in kpis)),
-                "total_kpis": len(kpis),
-                "total_violations": len(violations),
-                "total_alerts": len(alerts),
-                "high_risk_apps": len([
-                    v for v in violations 
-                    if v.severity in ["HIGH", "CRITICAL"]
-                ])
+                "total_applications": len(state["app_ids"]),
+                "total_kpis": state["total_kpis"],
+                "total_violations": state["total_violations"],
+                "total_alerts": state["total_alerts"],
+                "high_risk_apps": severity_counts["HIGH"] + severity_counts["CRITICAL"]
             },
-            "violations_by_severity": {},
-            "top_violating_apps": {},
+            "violations_by_severity": dict(severity_counts),
+            "top_violating_apps": dict(
+                nlargest(10, state["app_violations"].items(), key=itemgetter(1))
+            ),
             "recommendations": []
         }
         
-        # Categorize violations by severity
-        for violation in violations:
-            severity = violation.severity.value
-            report["violations_by_severity"][severity] = \
-                report["violations_by_severity"].get(severity, 0) + 1
-        
-        # Find top violating applications
-        app_violations = {}
-        for violation in violations:
-            app_violations[violation.app_id] = \
-                app_violations.get(violation.app_id, 0) + 1
-        
-        report["top_violating_apps"] = dict(
-            sorted(app_violations.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-        
         # Generate recommendations
         if report["summary"]["high_risk_apps"] > 0:
             report["recommendations"].append(
@@ -302,11 +459,14 @@ async def generate_compliance_report(services: Dict[str, Any]) -> Dict[str, Any]
         report_path = f"reports/compliance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         Path("reports").mkdir(exist_ok=True)
         
-        import json
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        # Encode once and write in a single call; json.dump would stream
+        # many small chunks through the file object
+        payload = encode_report(report)
+        with open(report_path, 'wb') as f:
+            f.write(payload)
         
         logger.info(f"Compliance report saved to {report_path}")
+        _save_report_state(state)
         
         # Log report generation
         container.audit_logger.log_configuration_change(
@@ -346,15 +506,21 @@ async def cleanup_processed_files(processed_files: List[str],
         archive_path = Path(archive_dir)
         archive_path.mkdir(exist_ok=True)
         
-        for file_path in processed_files:
-            source = Path(file_path)
-            if source.exists():
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # One timestamp per batch; renames resolve names against an open
+        # archive directory fd instead of the full destination path
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        archive_fd = os.open(archive_path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for file_path in processed_files:
+                source = Path(file_path)
                 filename = f"{source.stem}_{timestamp}{source.suffix}"
-                destination = archive_path / filename
-                
-                source.rename(destination)
-                logger.info(f"Archived {file_path} to {destination}")
+                try:
+                    os.rename(file_path, filename, dst_dir_fd=archive_fd)
+                except FileNotFoundError:
+                    continue
+                logger.info(f"Archived {file_path} to {archive_path / filename}")
+        finally:
+            os.close(archive_fd)
         
     except Exception as e:
         logger.error(f"File cleanup failed: {str(e)}")
@@ -370,7 +536,9 @@ async def uam_compliance_flow(
     data_dir: str = "data/incoming",
     config_path: str = "config",
     archive_dir: str = "data/archive",
-    generate_report: bool = True
+    generate_report: bool = True,
+    max_parallel_files: int = MAX_PARALLEL_FILES,
+    rebuild_report: bool = False
 ) -> Dict[str, Any]:
     """
     Main UAM compliance processing workflow.
@@ -380,10 +548,15 @@ async def uam_compliance_flow(
         config_path: Configuration directory path
         archive_dir: Archive directory for processed files
         generate_report: Whether to generate compliance report
+        max_parallel_files: Maximum number of files processed concurrently
+        rebuild_report: Recompute report aggregates from all stored records
         
     Returns:
         Workflow execution summary
     """
+    # Same pandas mode as every other entry point (src/main.py, scheduler)
+    pd.set_option("mode.copy_on_write", True)
+    
     logger = get_run_logger()
     logger.info("Starting UAM Compliance Processing workflow")
     
@@ -402,15 +575,27 @@ async def uam_compliance_flow(
                 "message": "No files found for processing"
             }
         
-        # Process each file
+        # Process files concurrently, bounded by a semaphore
+        semaphore = asyncio.Semaphore(max(1, max_parallel_files))
+        
+        async def process_bounded(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await process_csv_file(file_path, services)
+        
+        outcomes = await asyncio.gather(
+            *(process_bounded(file_path) for file_path in csv_files),
+            return_exceptions=True
+        )
+        
         processing_results = []
         processed_files = []
-        
-        for file_path in csv_files:
-            result = await process_csv_file(file_path, services)
-            processing_results.append(result)
+        for file_path, outcome in zip(csv_files, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Processing task failed for {file_path}: {str(outcome)}")
+                outcome = {"file_path": file_path, "success": False, "error": str(outcome)}
+            processing_results.append(outcome)
             
-            if result["success"]:
+            if outcome["success"]:
                 processed_files.append(file_path)
         
         # Archive processed files
@@ -420,11 +605,20 @@ async def uam_compliance_flow(
         # Generate compliance report
         report = None
         if generate_report:
-            report = await generate_compliance_report(services)
-        
-        # Prepare summary
-        successful_files = [r for r in processing_results if r["success"]]
-        failed_files = [r for r in processing_results if not r["success"]]
+            report = await generate_compliance_report(services, rebuild=rebuild_report)
+        
+        # Prepare summary: tally all per-file results in one pass
+        files_processed = total_records = total_kpis = total_violations = total_alerts = 0
+        errors = []
+        for r in processing_results:
+            if r["success"]:
+                files_processed += 1
+                total_records += r.get("records_processed", 0)
+                total_kpis += r.get("kpis_computed", 0)
+                total_violations += r.get("violations_found", 0)
+                total_alerts += r.get("alerts_generated", 0)
+            else:
+                errors.append(r.get("error"))
         
         summary = {
             "status": "completed",
@@ -432,14 +626,14 @@ async def uam_compliance_flow(
             "started_at": prefect.context.get_start_time(),
             "completed_at": datetime.now(),
             "files_found": len(csv_files),
-            "files_processed": len(successful_files),
-            "files_failed": len(failed_files),
-            "total_records": sum(r.get("records_processed", 0) for r in successful_files),
-            "total_kpis": sum(r.get("kpis_computed", 0) for r in successful_files),
-            "total_violations": sum(r.get("violations_found", 0) for r in successful_files),
-            "total_alerts": sum(r.get("alerts_generated", 0) for r in successful_files),
+            "files_processed": files_processed,
+            "files_failed": len(errors),
+            "total_records": total_records,
+            "total_kpis": total_kpis,
+            "total_violations": total_violations,
+            "total_alerts": total_alerts,
             "report_generated": report is not None,
-            "errors": [r.get("error") for r in failed_files]
+            "errors": errors
         }
         
         logger.info(f"Workflow completed: {summary}")
@@ -474,14 +668,15 @@ async def uam_daily_compliance() -> Dict[str, Any]:
 
 
 # Deployments
+@lru_cache(maxsize=1)
 def create_deployments():
-    """Create Prefect deployments for workflows."""
+    """Create Prefect deployments for workflows (built once per process)."""
     
     # Daily compliance check at 2 AM UTC
     daily_deployment = Deployment.build_from_flow(
         flow=uam_daily_compliance,
         name="Daily UAM Compliance Check",
-        schedule=CronSchedule(cron="0 2 * * *"),  # 2 AM UTC daily
+        schedule=DAILY_2AM_SCHEDULE,
         tags=["compliance", "daily"],
         description="Automated daily compliance monitoring and reporting"
     )
@@ -494,13 +689,11 @@ def create_deployments():
         description="Manual compliance processing workflow"
     )
     
-    return [daily_deployment, on_demand_deployment]
+    return (daily_deployment, on_demand_deployment)
 
 
 if __name__ == "__main__":
     # Example usage
-    import asyncio
-    
     # Run on-demand processing
     result = asyncio.run(uam_compliance_flow())
     print(f"Processing result: {result}")
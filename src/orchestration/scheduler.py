@@ -5,16 +5,79 @@ Provides automated scheduling and execution of compliance workflows.
 """
 
 import asyncio
-import schedule
+import json
+import os
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from graphlib import TopologicalSorter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple
 
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional; reports fall back to the stdlib encoder
+    orjson = None
+
+from ..adapters.audit import StructlogAuditLogger
 from ..composition_root import ServiceContainer
 from ..interfaces.errors import ProcessingError
 
 
+# Working directories, relative to the scheduler's working directory
+INCOMING_DIR = Path("data/incoming")
+ARCHIVE_DIR = Path("data/archive")
+REPORTS_DIR = Path("reports")
+
+# Files processed concurrently per workflow run (bounds storage/notification load)
+MAX_PARALLEL_FILES = 4
+
+# Per-file pipeline as stage -> prerequisite stages; each stage maps to a
+# _stage_<name> method and the order is frozen once at initialize()
+PIPELINE_GRAPH: Dict[str, Tuple[str, ...]] = {
+    "parse": (),
+    "kpis": ("parse",),
+    "evaluate": ("kpis",),
+    "notify": ("evaluate",),
+}
+
+# Severities counted as high risk in the daily report
+_HIGH_RISK = frozenset({"HIGH", "CRITICAL"})
+
+
+@lru_cache(maxsize=4)
+def _build_container(config_path: str) -> ServiceContainer:
+    """Build (once per config path) and warm up the production container."""
+    container = ServiceContainer.production(config_path)
+    container.warmup()
+    # Audit records are written by a listener thread, off the pipeline's path
+    if isinstance(container.audit_logger, StructlogAuditLogger):
+        container.audit_logger.start_background_writes()
+    return container
+
+
+def encode_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report as indented JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(report, indent=2, default=str).encode("utf-8")
+
+
+def seconds_until(hour: int, minute: int, now: Optional[datetime] = None) -> float:
+    """Seconds from now until the next occurrence of hour:minute."""
+    now = now or datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
 class ComplianceScheduler:
     """Simple scheduler for compliance workflows."""
     
@@ -23,12 +86,15 @@ class ComplianceScheduler:
         self.config_path = config_path
         self.container = None
         self.logger = None
+        self._stages: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
         
     def initialize(self):
         """Initialize services and logging."""
         try:
-            self.container = ServiceContainer.create_production(self.config_path)
+            self.container = _build_container(self.config_path)
             self.logger = self.container.audit_logger
+            self._stages = self._build_pipeline()
+            REPORTS_DIR.mkdir(exist_ok=True)
             
             self.logger.log_configuration_change(
                 user_id="system",
@@ -52,7 +118,9 @@ class ComplianceScheduler:
                 context={"operation": "process_compliance_workflow"}
             )
         
+        # Wall-clock stamps for the result; durations use the monotonic clock
         start_time = datetime.now()
+        t0 = time.perf_counter()
         self.logger.log_data_access(
             user_id="system",
             resource_type="WORKFLOW",
@@ -62,7 +130,7 @@ class ComplianceScheduler:
         
         try:
             # Discover data files
-            data_dir = Path("data/incoming")
+            data_dir = INCOMING_DIR
             if not data_dir.exists():
                 return {
                     "status": "completed",
@@ -86,106 +154,36 @@ class ComplianceScheduler:
                 "errors": []
             }
             
-            # Process each file
-            for file_path in csv_files:
-                try:
-                    # Parse CSV
-                    data = self.container.csv_parser.parse(str(file_path))
-                    results["total_records"] += len(data)
-                    
-                    # Compute KPIs
-                    kpis = []
-                    for app_id in data['app_id'].unique():
-                        app_data = data[data['app_id'] == app_id]
-                        for calculator in self.container.kpi_calculators:
-                            try:
-                                kpi = calculator.compute(app_data)
-                                if kpi:
-                                    kpis.append(kpi)
-                                    self.container.storage.save_kpi(kpi)
-                            except Exception as e:
-                                self.logger.log_data_access(
-                                    user_id="system",
-                                    resource_type="KPI_CALCULATION",
-                                    resource_id=f"{app_id}_{calculator.__class__.__name__}",
-                                    action="ERROR",
-                                    reason=str(e)
-                                )
-                    
-                    results["kpis_computed"] += len(kpis)
-                    
-                    # Evaluate policies
-                    violations = []
-                    for kpi in kpis:
-                        try:
-                            violation = self.container.policy_engine.evaluate(kpi)
-                            if violation:
-                                violations.append(violation)
-                                self.container.storage.save_violation(violation)
-                        except Exception as e:
-                            self.logger.log_data_access(
-                                user_id="system",
-                                resource_type="POLICY_EVALUATION",
-                                resource_id=kpi.app_id,
-                                action="ERROR",
-                                reason=str(e)
-                            )
-                    
-                    results["violations_found"] += len(violations)
-                    
-                    # Generate alerts
-                    if violations:
-                        try:
-                            alert = self.container.alert_generator.create_alert(violations)
-                            if alert:
-                                self.container.storage.save_alert(alert)
-                                
-                                # Send notifications
-                                self.container.slack_adapter.send_alert(alert)
-                                self.container.email_adapter.send_alert(alert)
-                                
-                                results["alerts_generated"] += 1
-                        except Exception as e:
-                            self.logger.log_data_access(
-                                user_id="system",
-                                resource_type="ALERT_GENERATION",
-                                resource_id=str(file_path),
-                                action="ERROR",
-                                reason=str(e)
-                            )
-                    
-                    # Archive processed file
-                    archive_dir = Path("data/archive")
-                    archive_dir.mkdir(exist_ok=True)
-                    
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    archive_path = archive_dir / f"{file_path.stem}_{timestamp}{file_path.suffix}"
-                    file_path.rename(archive_path)
-                    
-                    results["files_processed"] += 1
-                    
-                    self.logger.log_data_access(
-                        user_id="system",
-                        resource_type="CSV_FILE",
-                        resource_id=str(file_path),
-                        action="PROCESSED",
-                        success=True
-                    )
-                    
-                except Exception as e:
-                    error_msg = f"Failed to process {file_path}: {str(e)}"
-                    results["errors"].append(error_msg)
-                    self.logger.log_data_access(
-                        user_id="system",
-                        resource_type="CSV_FILE",
-                        resource_id=str(file_path),
-                        action="ERROR",
-                        reason=str(e)
-                    )
+            # Process files concurrently in worker threads, bounded by a semaphore
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_FILES)
+            
+            async def process_bounded(file_path: Path) -> Dict[str, Any]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._process_file, file_path)
+            
+            processed = []
+            file_counts = await asyncio.gather(*(process_bounded(p) for p in csv_files))
+            for file_path, counts in zip(csv_files, file_counts):
+                error = counts.pop("error", None)
+                if error:
+                    results["errors"].append(error)
+                else:
+                    processed.append(file_path)
+                for key, value in counts.items():
+                    results[key] += value
+            
+            # Archive the successfully processed files together, stamped
+            # with the workflow start
+            results["errors"].extend(
+                await asyncio.to_thread(
+                    self._archive_files,
+                    processed,
+                    start_time.strftime('%Y%m%d_%H%M%S')
+                )
+            )
             
             # Log completion
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - t0
             
             self.logger.log_data_access(
                 user_id="system",
@@ -198,7 +196,7 @@ class ComplianceScheduler:
             results.update({
                 "status": "completed",
                 "started_at": start_time.isoformat(),
-                "completed_at": end_time.isoformat(),
+                "completed_at": datetime.now().isoformat(),
                 "duration_seconds": duration,
                 "records_per_second": results["total_records"] / duration if duration > 0 else 0
             })
@@ -217,6 +215,153 @@ class ComplianceScheduler:
                 message=f"Compliance workflow failed: {str(e)}"
             )
     
+    def _build_pipeline(self) -> Tuple[Callable[[Dict[str, Any]], None], ...]:
+        """Freeze PIPELINE_GRAPH into an ordered tuple of bound stage methods."""
+        order = TopologicalSorter(PIPELINE_GRAPH).static_order()
+        return tuple(getattr(self, f"_stage_{name}") for name in order)
+    
+    def _process_file(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Run the blocking parse/KPI/policy/alert pipeline for one file.
+        
+        Called from a worker thread; runs the stages frozen at initialize()
+        over a fresh per-file state and returns this file's counters, with
+        any failure recorded under "error".
+        """
+        counts = {
+            "files_processed": 0,
+            "total_records": 0,
+            "kpis_computed": 0,
+            "violations_found": 0,
+            "alerts_generated": 0
+        }
+        # Errors are collected as (resource_type, resource_id, reason) and
+        # audited together once the file is done
+        error_records: List[Tuple[str, str, str]] = []
+        state = {
+            "file_path": file_path,
+            "counts": counts,
+            "record_error": error_records.append
+        }
+        
+        try:
+            for stage in self._stages:
+                stage(state)
+            counts["files_processed"] = 1
+        except Exception as e:
+            counts["error"] = f"Failed to process {file_path}: {str(e)}"
+            error_records.append(("CSV_FILE", str(file_path), str(e)))
+        
+        self.logger.log_data_access_batch(error_records)
+        return counts
+    
+    def _stage_parse(self, state: Dict[str, Any]) -> None:
+        """Parse the CSV file into state["data"]."""
+        data, _ = self.container.csv_parser().parse(str(state["file_path"]))
+        state["data"] = data
+        state["counts"]["total_records"] = len(data)
+    
+    def _stage_kpis(self, state: Dict[str, Any]) -> None:
+        """
+        Compute KPIs into state["kpis"].
+        
+        The whole-frame aggregators cover every KPI between them, each in
+        one pass over all apps (persisted by the aggregator).
+        """
+        container = self.container
+        kpis = []
+        for aggregator in (
+            container.count_kpi_aggregator(),
+            container.row_kpi_aggregator(),
+            container.group_kpi_aggregator()
+        ):
+            try:
+                kpis.extend(aggregator.compute_all(state["data"]))
+            except Exception as e:
+                state["record_error"]((
+                    "KPI_CALCULATION",
+                    f"ALL_{aggregator.__class__.__name__}",
+                    str(e)
+                ))
+        
+        state["kpis"] = kpis
+        state["counts"]["kpis_computed"] = len(kpis)
+    
+    def _stage_evaluate(self, state: Dict[str, Any]) -> None:
+        """Evaluate every KPI in one batch (persisted once) into state["violations"]."""
+        violations = []
+        try:
+            violations = self.container.policy_engine().evaluate_batch(
+                (kpi.app_id, kpi.kpi_name, kpi.value) for kpi in state["kpis"]
+            )
+        except Exception as e:
+            state["record_error"](("POLICY_EVALUATION", str(state["file_path"]), str(e)))
+        
+        state["violations"] = violations
+        state["counts"]["violations_found"] = len(violations)
+    
+    def _stage_notify(self, state: Dict[str, Any]) -> None:
+        """Generate alerts; persisted in one write, then sent."""
+        violations = state["violations"]
+        if not violations:
+            return
+        try:
+            alerts = self.container.alert_generator().generate_batch(violations)
+            state["counts"]["alerts_generated"] = len(alerts)
+        except Exception as e:
+            state["record_error"](("ALERT_GENERATION", str(state["file_path"]), str(e)))
+    
+    def _archive_files(self, file_paths: List[Path], timestamp: str) -> List[str]:
+        """
+        Move processed files into the archive under one workflow timestamp.
+        
+        Returns an error message for each file that could not be moved.
+        """
+        if not file_paths:
+            return []
+        
+        archive_dir = ARCHIVE_DIR
+        archive_dir.mkdir(exist_ok=True)
+        
+        # Where supported (Linux/macOS), renames resolve the destination name
+        # against an archive directory fd opened once per batch instead of
+        # walking the full path for every file
+        archive_fd = None
+        if os.replace in os.supports_dir_fd and hasattr(os, "O_DIRECTORY"):
+            archive_fd = os.open(archive_dir, os.O_RDONLY | os.O_DIRECTORY)
+        
+        errors = []
+        try:
+            for file_path in file_paths:
+                archive_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+                try:
+                    if archive_fd is not None:
+                        os.replace(file_path, archive_name, dst_dir_fd=archive_fd)
+                    else:
+                        os.replace(file_path, archive_dir / archive_name)
+                except OSError as e:
+                    errors.append(f"Failed to archive {file_path}: {str(e)}")
+                    self.logger.log_data_access(
+                        user_id="system",
+                        resource_type="CSV_FILE",
+                        resource_id=str(file_path),
+                        action="ERROR",
+                        reason=str(e)
+                    )
+                    continue
+                
+                self.logger.log_data_access(
+                    user_id="system",
+                    resource_type="CSV_FILE",
+                    resource_id=str(file_path),
+                    action="PROCESSED",
+                    success=True
+                )
+        finally:
+            if archive_fd is not None:
+                os.close(archive_fd)
+        return errors
+    
     def generate_daily_report(self) -> Dict[str, Any]:
         """Generate daily compliance report."""
         if not self.container:
@@ -231,6 +376,17 @@ class ComplianceScheduler:
             violations = self.container.storage.load_violations()
             alerts = self.container.storage.load_alerts()
             
+            # Categorize violations by app and severity in one frame
+            vdf = pd.DataFrame(
+                {
+                    "app_id": [v.app_id for v in violations],
+                    "severity": [v.severity.value for v in violations],
+                },
+                dtype="object"
+            )
+            by_app = vdf.groupby("app_id", sort=False, observed=True).size().to_dict()
+            by_severity = vdf["severity"].value_counts().to_dict()
+            
             # Generate report
             report = {
                 "generated_at": datetime.now().isoformat(),
@@ -239,26 +395,15 @@ class ComplianceScheduler:
                     "total_kpis": len(kpis),
                     "total_violations": len(violations),
                     "total_alerts": len(alerts),
-                    "high_risk_violations": len([
-                        v for v in violations 
-                        if v.severity.value in ["HIGH", "CRITICAL"]
-                    ])
+                    "high_risk_violations": sum(
+                        n for severity, n in by_severity.items() if severity in _HIGH_RISK
+                    )
                 },
-                "violations_by_app": {},
-                "violations_by_severity": {},
+                "violations_by_app": by_app,
+                "violations_by_severity": by_severity,
                 "recommendations": []
             }
             
-            # Categorize violations
-            for violation in violations:
-                app_id = violation.app_id
-                severity = violation.severity.value
-                
-                report["violations_by_app"][app_id] = \
-                    report["violations_by_app"].get(app_id, 0) + 1
-                report["violations_by_severity"][severity] = \
-                    report["violations_by_severity"].get(severity, 0) + 1
-            
             # Generate recommendations
             if report["summary"]["high_risk_violations"] > 0:
                 report["recommendations"].append(
@@ -270,15 +415,9 @@ class ComplianceScheduler:
                     "Consider tightening access policies"
                 )
             
-            # Save report
-            reports_dir = Path("reports")
-            reports_dir.mkdir(exist_ok=True)
-            
-            report_file = reports_dir / f"compliance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            import json
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            # Save report (REPORTS_DIR is created by initialize())
+            report_file = REPORTS_DIR / f"compliance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            report_file.write_bytes(encode_report(report))
             
             self.logger.log_configuration_change(
                 user_id="system",
@@ -300,11 +439,6 @@ class ComplianceScheduler:
         if not self.container:
             self.initialize()
         
-        # Schedule jobs
-        schedule.every().day.at("02:00").do(self.run_daily_compliance)
-        schedule.every().day.at("06:00").do(self.generate_daily_report)
-        schedule.every().hour.do(self.check_for_new_files)
-        
         print("🚀 UAM Compliance Scheduler started")
         print("📅 Scheduled jobs:")
         print("   - Daily compliance check: 02:00 UTC")
@@ -313,11 +447,43 @@ class ComplianceScheduler:
         print("\nPress Ctrl+C to stop...")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            asyncio.run(self._run_scheduler())
         except KeyboardInterrupt:
             print("\n🛑 Scheduler stopped")
+        finally:
+            # Evict before closing so a later initialize() builds a fresh
+            # container instead of getting this closed one from the cache
+            _build_container.cache_clear()
+            self.container.close()
+            self.container = None
+    
+    async def _run_scheduler(self):
+        """Run all scheduled jobs on one event loop."""
+        await asyncio.gather(
+            self._run_daily(2, 0, self.run_daily_compliance),
+            self._run_daily(6, 0, lambda: asyncio.to_thread(self.generate_daily_report)),
+            self._run_every(3600, self.check_for_new_files)
+        )
+    
+    async def _run_daily(self, hour: int, minute: int,
+                         job: Callable[[], Awaitable[Any]]):
+        """Sleep until hour:minute, run job, repeat."""
+        while True:
+            await asyncio.sleep(seconds_until(hour, minute))
+            await self._run_job(job)
+    
+    async def _run_every(self, seconds: float, job: Callable[[], Awaitable[Any]]):
+        """Run job every given number of seconds."""
+        while True:
+            await asyncio.sleep(seconds)
+            await self._run_job(job)
+    
+    async def _run_job(self, job: Callable[[], Awaitable[Any]]):
+        """Await a scheduled job; a failure must not stop the other jobs."""
+        try:
+            await job()
+        except Exception as e:
+            print(f"⚠️  Scheduled job failed: {str(e)}")
     
     async def run_daily_compliance(self):
         """Run daily compliance workflow."""
@@ -327,23 +493,26 @@ class ComplianceScheduler:
         if result.get('errors'):
             print(f"⚠️  Errors encountered: {len(result['errors'])}")
     
-    def check_for_new_files(self):
+    async def check_for_new_files(self):
         """Check for new files and process if found."""
-        data_dir = Path("data/incoming")
-        if not data_dir.exists():
-            return
+        if not self.container:
+            self.initialize()
         
-        # Find files modified in last hour
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        new_files = [
-            f for f in data_dir.glob("*.csv")
-            if datetime.fromtimestamp(f.stat().st_mtime) > cutoff_time
-        ]
+        # Find files modified in last hour; DirEntry caches its stat and
+        # mtimes are compared as raw timestamps
+        cutoff = time.time() - 3600.0
+        try:
+            with os.scandir(INCOMING_DIR) as entries:
+                new_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".csv") and entry.stat().st_mtime > cutoff
+                ]
+        except FileNotFoundError:
+            return
         
         if new_files:
             print(f"📁 Found {len(new_files)} new files")
-            # Trigger async processing
-            asyncio.create_task(self.process_compliance_workflow())
+            await self.process_compliance_workflow()
 
 
 def main():
@@ -365,6 +534,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Same pandas mode as every other entry point (src/main.py, Prefect flows)
+    pd.set_option("mode.copy_on_write", True)
+    
     scheduler = ComplianceScheduler(args.config)
     
     if args.mode == "scheduler":
@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration.
+"""
+
+import pandas as pd
+
+# Match the pipeline entry points (src/main.py, the scheduler and Prefect
+# flows): with Copy-on-Write, copies, slices and .assign share untouched
+# columns instead of duplicating them
+pd.set_option("mode.copy_on_write", True)
@@ -2,16 +2,16 @@
 Mock adapters for testing.
 """
 
-from datetime import datetime
-from src.interfaces.dto import Alert, DeliveryResult
-from src.interfaces.ports import SlackSender, EmailSender
+from src.interfaces.dto import Alert, AuditEvent, DeliveryResult
+from src.interfaces.ports import AuditLogger, Clock, SlackSender, EmailSender
 
 
 class InMemorySlackSender(SlackSender):
     """In-memory Slack sender for testing."""
     
-    def __init__(self, bot_token: str):
+    def __init__(self, bot_token: str, clock: Clock):
         self.bot_token = bot_token
+        self._clock = clock
         self.sent_alerts = []
     
     def send(self, alert: Alert) -> DeliveryResult:
@@ -19,7 +19,7 @@ class InMemorySlackSender(SlackSender):
         self.sent_alerts.append(alert)
         return DeliveryResult(
             success=True,
-            delivered_at=datetime.now(),
+            delivered_at=self._clock.now(),
             retries=0
         )
 
@@ -27,10 +27,13 @@ class InMemorySlackSender(SlackSender):
 class InMemoryEmailSender(EmailSender):
     """In-memory Email sender for testing."""
     
-    def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str):
+    def __init__(
+        self, smtp_host: str, smtp_port: int, username: str, password: str, clock: Clock
+    ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
         self.username = username
+        self._clock = clock
         self.sent_alerts = []
     
     def send(self, alert: Alert) -> DeliveryResult:
@@ -38,7 +41,7 @@ class InMemoryEmailSender(EmailSender):
         self.sent_alerts.append(alert)
         return DeliveryResult(
             success=True,
-            delivered_at=datetime.now(),
+            delivered_at=self._clock.now(),
             retries=0
         )
     
@@ -47,6 +50,13 @@ class InMemoryEmailSender(EmailSender):
         self.sent_alerts.extend(alerts)
         return DeliveryResult(
             success=True,
-            delivered_at=datetime.now(),
+            delivered_at=self._clock.now(),
             retries=0
-        )
\ No newline at end of file
+        )
+
+
+class NullAuditLogger(AuditLogger):
+    """Audit logger that discards events (no files, no serialization)."""
+    
+    def log(self, event: AuditEvent) -> None:
+        """Drop event."""
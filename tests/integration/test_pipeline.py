@@ -4,23 +4,87 @@ Integration tests for the complete UAM Compliance pipeline.
 Tests end-to-end flow using in-memory adapters.
 """
 
+import io
 import pytest
 import pandas as pd
 from datetime import datetime
 
 from src.composition_root import ServiceContainer
-from src.interfaces.dto import Severity
+from src.interfaces.dto import Severity, Thresholds
 from src.adapters.storage.in_memory import InMemoryStorage
 from src.adapters.openai_adapter import MockOpenAIClient
 from src.adapters.clock import FixedClock
+from src.modules.config.loader import SystemConfig, NotificationSettings, AISettings
+from tests.integration.mock_adapters import (
+    InMemorySlackSender,
+    InMemoryEmailSender,
+    NullAuditLogger
+)
+
+
+# Sample UAM CSV data, built once at import; rows are also labelled by
+# user_id so single cells can be addressed with .at
+_DATE_COLUMNS = [
+    'exit_date', 'access_request_date', 'access_granted_date',
+    'last_review_date', 'account_created_date', 'last_login_date'
+]
+_USER_IDS = ['U001', 'U002', 'U003', 'U004', 'U005', 'U006']
+_CANONICAL_DF = pd.DataFrame({
+    'app_id': ['APP-001', 'APP-001', 'APP-001', 'APP-001', 'APP-002', 'APP-002'],
+    'user_id': _USER_IDS,
+    'username': ['alice', 'bob', 'charlie', 'dave', 'eve', 'frank'],
+    'manager_id': ['U002', 'M900', 'M901', 'M900', None, 'M902'],
+    'status': ['active', 'active', 'active', 'active', 'active', 'active'],
+    'is_privileged': [True, False, True, True, False, False],
+    'exit_date': [None, '2025-10-01', '2025-10-15', '2025-10-20', None, '2025-10-15'],
+    'failed_attempts': [0, 2, 0, 30, 35, 0],
+    'access_request_date': ['2025-09-01', '2025-09-15', '2025-10-01', '2025-09-10', '2025-10-05', '2025-10-01'],
+    'access_granted_date': ['2025-09-02', '2025-09-16', '2025-10-02', '2025-09-25', '2025-10-06', '2025-10-02'],
+    'last_review_date': ['2025-09-15', '2025-09-15', '2025-10-15', '2025-09-20', '2025-10-15', '2025-10-15'],
+    'account_created_date': ['2025-01-01', '2025-02-01', '2025-03-01', '2025-04-01', '2025-05-01', '2025-06-01'],
+    'last_login_date': ['2025-10-30', '2025-10-15', '2025-11-01', '2025-10-20', '2025-10-10', '2025-11-01']
+}, index=pd.Index(_USER_IDS))
+# Store columns in their working dtypes (typed arrays rather than Python
+# objects), so parsing the fixture only has no-op conversions left
+_CANONICAL_DF = _CANONICAL_DF.astype({
+    'status': 'category',
+    'is_privileged': 'boolean',
+    'failed_attempts': 'int32',
+})
+_CANONICAL_DF[_DATE_COLUMNS] = _CANONICAL_DF[_DATE_COLUMNS].apply(pd.to_datetime)
+
+
+def _with_high_failures(df):
+    """Copy of df where dave (U004) has 75 failed access attempts."""
+    # Only failed_attempts is rebuilt; other columns are shared (Copy-on-Write)
+    return df.assign(failed_attempts=df['failed_attempts'].mask(df.index == 'U004', 75))
+
+
+def _expected_kpis(df):
+    """Expected KPI values per app_id, from one groupby over the raw data."""
+    # Orphan: has a manager who is not one of the same app's users
+    managed_by_app_user = pd.MultiIndex.from_frame(df[['app_id', 'manager_id']]).isin(
+        pd.MultiIndex.from_frame(df[['app_id', 'user_id']])
+    )
+    df = df.assign(orphan=df['manager_id'].notna() & ~managed_by_app_user)
+    return df.groupby('app_id', sort=False).agg(
+        orphan_accounts=('orphan', 'sum'),
+        privileged_accounts=('is_privileged', 'sum'),
+        failed_access_attempts=('failed_attempts', 'sum'),
+    ).astype(float).to_dict('index')
+
+
+# Assertion oracles, computed once at import
+EXPECTED_KPIS = _expected_kpis(_CANONICAL_DF)
+HIGH_FAILURES_EXPECTED_KPIS = _expected_kpis(_with_high_failures(_CANONICAL_DF))
 
 
 class TestEndToEndPipeline:
     """Test complete pipeline from CSV parsing to alert dispatch."""
 
-    @pytest.fixture
-    def test_container(self):
-        """Create test container with in-memory adapters."""
+    @pytest.fixture(scope="session")
+    def _shared_container(self):
+        """Build the in-memory test container once for the whole session."""
         # Fixed time for deterministic tests
         fixed_time = datetime(2025, 11, 2, 9, 0, 0)
         clock = FixedClock(fixed_time)
@@ -28,44 +92,13 @@ class TestEndToEndPipeline:
         # In-memory storage
         storage = InMemoryStorage()
         
-        # Mock adapters
-        from src.adapters.audit import StructlogAuditLogger
-        
-        # Create in-memory mock adapters for testing
-        class InMemorySlackSender:
-            def __init__(self, bot_token: str):
-                self.bot_token = bot_token
-                self.sent_alerts = []
-            
-            def send(self, alert):
-                self.sent_alerts.append(alert)
-                from src.interfaces.dto import DeliveryResult
-                return DeliveryResult(success=True, delivered_at=datetime.now())
-        
-        class InMemoryEmailSender:
-            def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str):
-                self.smtp_host = smtp_host
-                self.sent_alerts = []
-            
-            def send(self, alert):
-                self.sent_alerts.append(alert)
-                from src.interfaces.dto import DeliveryResult
-                return DeliveryResult(success=True, delivered_at=datetime.now())
-                
-            def send_digest(self, alerts):
-                self.sent_alerts.extend(alerts)
-                from src.interfaces.dto import DeliveryResult
-                return DeliveryResult(success=True, delivered_at=datetime.now())
-        
-        slack = InMemorySlackSender("xoxb-test")
-        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test")
+        # In-memory mock adapters for testing
+        slack = InMemorySlackSender("xoxb-test", clock)
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
         openai = MockOpenAIClient("High risk due to orphan account spike")
-        audit_logger = StructlogAuditLogger(log_dir="./test_logs")
+        audit_logger = NullAuditLogger()
         
         # Test configuration
-        from src.modules.config.loader import SystemConfig, NotificationSettings, AISettings
-        from src.interfaces.dto import Thresholds
-        
         config = SystemConfig(
             thresholds=Thresholds(alert_thresholds={
                 "orphan_accounts": {"low": 1, "medium": 3, "high": 5, "critical": 10},
@@ -76,145 +109,119 @@ class TestEndToEndPipeline:
             ai_settings=AISettings()
         )
         
-        # Create container manually to avoid type issues
-        container = ServiceContainer(
+        return ServiceContainer(
             clock=clock,
             storage=storage,
-            slack=slack,  # type: ignore
-            email=email,  # type: ignore
+            slack=slack,
+            email=email,
             openai=openai,
             audit_logger=audit_logger,
             config=config
         )
-        return container
 
     @pytest.fixture
+    def test_container(self, _shared_container):
+        """Shared test container with storage and sent messages reset."""
+        storage = _shared_container.storage
+        storage.kpis.clear()
+        storage.violations.clear()
+        storage.alerts.clear()
+        _shared_container.slack.sent_alerts.clear()
+        _shared_container.email.sent_alerts.clear()
+        return _shared_container
+
+    @pytest.fixture(scope="module")
     def sample_csv_data(self):
-        """Create sample UAM CSV data for testing."""
-        return pd.DataFrame({
-            'app_id': ['APP-001', 'APP-001', 'APP-001', 'APP-001', 'APP-002', 'APP-002'],
-            'user_id': ['U001', 'U002', 'U003', 'U004', 'U005', 'U006'],
-            'username': ['alice', 'bob', 'charlie', 'dave', 'eve', 'frank'],
-            'status': ['active', 'active', 'active', 'active', 'active', 'active'],
-            'is_privileged': [True, False, True, True, False, False],
-            'exit_date': [None, '2025-10-01', '2025-10-15', '2025-10-20', None, '2025-10-15'],
-            'failed_attempts': [0, 2, 0, 30, 35, 0],
-            'access_request_date': ['2025-09-01', '2025-09-15', '2025-10-01', '2025-09-10', '2025-10-05', '2025-10-01'],
-            'access_granted_date': ['2025-09-02', '2025-09-16', '2025-10-02', '2025-09-25', '2025-10-06', '2025-10-02'],
-            'last_review_date': ['2025-09-15', '2025-09-15', '2025-10-15', '2025-09-20', '2025-10-15', '2025-10-15'],
-            'account_created_date': ['2025-01-01', '2025-02-01', '2025-03-01', '2025-04-01', '2025-05-01', '2025-06-01'],
-            'last_login_date': ['2025-10-30', '2025-10-15', '2025-11-01', '2025-10-20', '2025-10-10', '2025-11-01']
-        })
+        """Sample UAM CSV data; shared, so tests must not mutate it in place."""
+        # Module-private copy, so no test can reach the import-time frame
+        return _CANONICAL_DF.copy()
 
-    def test_critical_orphan_accounts_alert_flow(self, test_container, sample_csv_data, tmp_path):
-        """Test complete flow for critical orphan accounts violation."""
-        # Setup: Create CSV file with critical orphan accounts
-        csv_path = tmp_path / "uam_data.csv"
-        sample_csv_data.to_csv(csv_path, index=False)
+    @pytest.mark.parametrize("mutation,expected,app_id,checked_kpis,alert_kpi,expected_severity", [
+        pytest.param(
+            None, EXPECTED_KPIS, "APP-001",
+            # bob, charlie, dave report to managers outside APP-001 (3); alice, charlie,
+            # dave privileged (3); dave has 30 failed attempts (32 total)
+            ("orphan_accounts", "privileged_accounts", "failed_access_attempts"),
+            "orphan_accounts", Severity.MEDIUM,
+            id="critical_orphan_accounts"
+        ),
+        pytest.param(
+            _with_high_failures, HIGH_FAILURES_EXPECTED_KPIS, "APP-001",
+            # 75 + 2 lands between the high (50) and critical (100) thresholds
+            ("failed_access_attempts",),
+            "failed_access_attempts", Severity.HIGH,
+            id="high_failed_access_attempts"
+        ),
+    ])
+    def test_violation_alert_flow(
+        self, test_container, sample_csv_data,
+        mutation, expected, app_id, checked_kpis, alert_kpi, expected_severity
+    ):
+        """Test parse -> KPIs -> policy -> risk -> alert for one breaching KPI."""
+        data = mutation(sample_csv_data) if mutation else sample_csv_data
+        storage = test_container.storage
         
         # Get pipeline components
         csv_parser = test_container.csv_parser()
         policy_engine = test_container.policy_engine()
         risk_analyzer = test_container.risk_analyzer()
         alert_gen = test_container.alert_generator()
-        
-        # Step 1: Parse CSV
-        df, is_full_load = csv_parser.parse(str(csv_path))
-        assert len(df) == 6
+        calculators = {
+            "orphan_accounts": test_container.orphan_accounts_calculator(),
+            "privileged_accounts": test_container.privileged_accounts_calculator(),
+            "failed_access_attempts": test_container.failed_access_calculator(),
+        }
+        
+        # Step 1: Parse sample data (in memory, no CSV round-trip)
+        df, is_full_load = csv_parser.parse_dataframe(data)
+        assert df.shape[0] == 6
         assert is_full_load is False  # Only 2 apps, so not full load
         
-        # Step 2: Calculate KPIs for APP-001 (has 1 orphan account)
-        app_id = "APP-001"
-        kpi_values = {}
-        
-        orphan_calc = test_container.orphan_accounts_calculator()
-        kpi = orphan_calc.compute(df, app_id)
-        kpi_values["orphan_accounts"] = kpi.value
-        
-        privileged_calc = test_container.privileged_accounts_calculator()
-        kpi = privileged_calc.compute(df, app_id)
-        kpi_values["privileged_accounts"] = kpi.value
-        
-        failed_calc = test_container.failed_access_calculator()
-        kpi = failed_calc.compute(df, app_id)
-        kpi_values["failed_access_attempts"] = kpi.value
-        
-        # Verify KPI calculations
-        assert kpi_values["orphan_accounts"] == 3.0  # bob, charlie, dave exited but still active
-        assert kpi_values["privileged_accounts"] == 3.0  # alice, charlie, dave
-        assert kpi_values["failed_access_attempts"] == 32.0  # dave has 30 failed attempts
-        
-        # Step 3: Evaluate policies (should trigger MEDIUM for orphan_accounts and failed_access_attempts)
+        # Step 2: Calculate KPIs for the app from its groupby partition,
+        # shared by every calculator
+        app_data = df.groupby("app_id", sort=False).get_group(app_id)
+        kpi_values = {
+            kpi_name: calc.compute_from_group(app_data).value
+            for kpi_name, calc in calculators.items()
+        }
+        for kpi_name in checked_kpis:
+            assert kpi_values[kpi_name] == expected[app_id][kpi_name]
+        
+        # Verify KPIs persisted
+        stored = {k.kpi_name: k for k in storage.kpis}
+        assert stored[alert_kpi].value == kpi_values[alert_kpi]
+        assert stored[alert_kpi].app_id == app_id
+        
+        # Step 3: Evaluate policies
         violations = policy_engine.evaluate(app_id, kpi_values)
-        assert len(violations) >= 2  # Should have at least 2 violations
-        
-        orphan_violation = next((v for v in violations if "orphan" in v.rule_id), None)
-        assert orphan_violation is not None
-        assert orphan_violation.severity == Severity.MEDIUM
-        assert orphan_violation.app_id == app_id
+        violations_by_rule = {v.rule_id: v for v in violations}
+        violation = violations_by_rule[f"threshold_{alert_kpi}"]
+        assert violation.severity == expected_severity
+        assert violation.app_id == app_id
         
         # Step 4: Analyze risk
         risk_result = risk_analyzer.analyze(
             app_id=app_id,
-            kpi_name="orphan_accounts",
-            kpi_value=kpi_values["orphan_accounts"]
+            kpi_name=alert_kpi,
+            kpi_value=kpi_values[alert_kpi]
         )
         assert risk_result.risk_score > 0
         assert "High risk due to orphan account spike" in risk_result.explanation
         
         # Step 5: Generate and send alert
-        alert = alert_gen.generate_and_send(orphan_violation)
-        assert alert is not None
+        alert = alert_gen.generate_and_send(violation)
         assert alert.app_id == app_id
-        assert alert.severity == Severity.MEDIUM
+        assert alert.severity == expected_severity
         assert len(alert.violation_ids) > 0
         assert len(alert.recommendations) >= 3
         
-        # Verify alert persisted to storage
-        stored_alerts = test_container.storage.alerts
+        # Verify alert and violation persisted to storage
+        stored_alerts = storage.alerts
         assert len(stored_alerts) == 1
         assert stored_alerts[0].alert_id == alert.alert_id
-        
-        # Verify violation persisted
-        stored_violations = test_container.storage.query_violations(app_id, "NEW")
-        assert len(stored_violations) >= 1
+        assert len(storage.query_violations(app_id, "NEW")) >= 1
 
-    def test_high_failed_access_attempts_flow(self, test_container, sample_csv_data, tmp_path):
-        """Test flow for high failed access attempts."""
-        # Create data with high failed attempts
-        high_failure_data = sample_csv_data.copy()
-        high_failure_data.loc[high_failure_data['user_id'] == 'U004', 'failed_attempts'] = 75
-        
-        csv_path = tmp_path / "high_failures.csv"
-        high_failure_data.to_csv(csv_path, index=False)
-        
-        # Parse and process
-        csv_parser = test_container.csv_parser()
-        policy_engine = test_container.policy_engine()
-        alert_gen = test_container.alert_generator()
-        
-        df, _ = csv_parser.parse(str(csv_path))
-        
-        # Calculate KPIs for APP-001 (where U004 with 75 failed attempts belongs)
-        app_id = "APP-001"
-        kpi_values = {}
-        
-        failed_calc = test_container.failed_access_calculator()
-        kpi = failed_calc.compute(df, app_id)
-        kpi_values["failed_access_attempts"] = kpi.value
-        
-        # Should trigger HIGH severity (75 is between 50 and 100)
-        violations = policy_engine.evaluate(app_id, kpi_values)
-        failed_violation = next((v for v in violations if "failed" in v.rule_id), None)
-        
-        assert failed_violation is not None
-        assert failed_violation.severity == Severity.HIGH
-        
-        # Generate alert
-        alert = alert_gen.generate_and_send(failed_violation)
-        assert alert.severity == Severity.HIGH
-
-    def test_no_violations_scenario(self, test_container, tmp_path):
+    def test_no_violations_scenario(self, test_container):
         """Test scenario with no violations."""
         # Create clean data
         clean_data = pd.DataFrame({
@@ -232,21 +239,21 @@ class TestEndToEndPipeline:
             'last_login_date': ['2025-11-01']
         })
         
-        csv_path = tmp_path / "clean_data.csv"
-        clean_data.to_csv(csv_path, index=False)
-        
         # Process
         csv_parser = test_container.csv_parser()
         policy_engine = test_container.policy_engine()
         
-        df, _ = csv_parser.parse(str(csv_path))
+        df, _ = csv_parser.parse_dataframe(clean_data)
         
         app_id = "APP-003"
         kpi_values = {}
         
         # Calculate all KPIs
-        for calc_name in ["orphan_accounts_calculator", "privileged_accounts_calculator", "failed_access_calculator"]:
-            calc = getattr(test_container, calc_name)()
+        for calc in (
+            test_container.orphan_accounts_calculator(),
+            test_container.privileged_accounts_calculator(),
+            test_container.failed_access_calculator()
+        ):
             kpi = calc.compute(df, app_id)
             kpi_values[kpi.kpi_name] = kpi.value
         
@@ -254,37 +261,37 @@ class TestEndToEndPipeline:
         violations = policy_engine.evaluate(app_id, kpi_values)
         assert len(violations) == 0
 
-    def test_multiple_applications_processing(self, test_container, sample_csv_data, tmp_path):
+    def test_multiple_applications_processing(self, test_container, sample_csv_data):
         """Test processing multiple applications in one run."""
-        csv_path = tmp_path / "multi_app.csv"
-        sample_csv_data.to_csv(csv_path, index=False)
-        
         csv_parser = test_container.csv_parser()
         policy_engine = test_container.policy_engine()
         alert_gen = test_container.alert_generator()
         
-        df, _ = csv_parser.parse(str(csv_path))
+        df, _ = csv_parser.parse_dataframe(sample_csv_data)
+        # Categorical app_id: grouping works on integer codes and the
+        # distinct apps come straight from the categories
+        df["app_id"] = df["app_id"].astype("category")
+        assert list(df["app_id"].cat.categories) == ["APP-001", "APP-002"]
         
         # Process both applications
-        total_violations = 0
-        total_alerts = 0
+        all_violations = []
         
-        for app_id in df["app_id"].unique():
+        orphan_calc = test_container.orphan_accounts_calculator()
+        for app_id, group in df.groupby("app_id", sort=False, observed=True):
             kpi_values = {}
             
             # Calculate KPIs
-            orphan_calc = test_container.orphan_accounts_calculator()
-            kpi = orphan_calc.compute(df, app_id)
+            kpi = orphan_calc.compute_from_group(group)
             kpi_values["orphan_accounts"] = kpi.value
             
             # Evaluate policies
             violations = policy_engine.evaluate(app_id, kpi_values)
-            total_violations += len(violations)
-            
-            # Generate alerts for violations
-            for violation in violations:
-                alert = alert_gen.generate_and_send(violation)
-                total_alerts += 1
+            all_violations.extend(violations)
+        
+        # Generate alerts for every app's violations in one batch
+        alerts = alert_gen.generate_batch(all_violations)
+        total_violations = len(all_violations)
+        total_alerts = len(alerts)
         
         # Verify processing results
         assert total_violations > 0  # Should have some violations
@@ -292,48 +299,26 @@ class TestEndToEndPipeline:
         
         # Verify storage has records for both apps
         stored_alerts = test_container.storage.alerts
-        app_ids_in_alerts = set(alert.app_id for alert in stored_alerts)
+        assert len(stored_alerts) == total_alerts
+        app_ids_in_alerts = {a.app_id for a in stored_alerts}
         assert len(app_ids_in_alerts) >= 1  # At least one app had violations
 
-    def test_error_handling_invalid_csv(self, test_container, tmp_path):
+    def test_error_handling_invalid_csv(self, test_container):
         """Test error handling for malformed CSV."""
-        # Create invalid CSV with mismatched columns
-        invalid_csv_path = tmp_path / "invalid.csv"
-        invalid_csv_path.write_text("app_id,user_id\nAPP-001")  # Missing user_id value
+        # Invalid CSV with mismatched columns, parsed from memory
+        invalid_csv = io.StringIO("app_id,user_id\nAPP-001")  # Missing user_id value
         
         csv_parser = test_container.csv_parser()
         
         # Should handle gracefully - pandas will parse but we can test the error handling
         try:
-            df, is_full_load = csv_parser.parse(str(invalid_csv_path))
+            df, is_full_load = csv_parser.parse_stream(invalid_csv)
             # If parsing succeeds, that's okay - pandas is lenient
-            assert len(df) >= 0
+            assert df.shape[0] >= 0
         except Exception:
             # If it raises an exception, that's also acceptable
             pass
 
-    def test_kpi_persistence(self, test_container, sample_csv_data, tmp_path):
-        """Test that KPIs are properly persisted."""
-        csv_path = tmp_path / "kpi_test.csv"
-        sample_csv_data.to_csv(csv_path, index=False)
-        
-        csv_parser = test_container.csv_parser()
-        
-        df, _ = csv_parser.parse(str(csv_path))
-        
-        # Calculate KPIs
-        orphan_calc = test_container.orphan_accounts_calculator()
-        kpi = orphan_calc.compute(df, "APP-001")
-        
-        # Verify KPI persisted
-        stored_kpis = test_container.storage.kpis
-        assert len(stored_kpis) > 0
-        
-        orphan_kpi = next((k for k in stored_kpis if k.kpi_name == "orphan_accounts"), None)
-        assert orphan_kpi is not None
-        assert orphan_kpi.value == 3.0
-        assert orphan_kpi.app_id == "APP-001"
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
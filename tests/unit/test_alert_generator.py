@@ -0,0 +1,168 @@
+"""
+Unit tests for AlertGenerator.
+"""
+
+import threading
+import pytest
+from datetime import datetime
+
+from src.modules.alerting.generator import AlertGenerator
+from src.interfaces.dto import Violation, Severity
+from src.interfaces.errors import IntegrationError
+from src.adapters.storage.in_memory import InMemoryStorage
+from src.adapters.clock import FixedClock
+from tests.integration.mock_adapters import InMemorySlackSender, InMemoryEmailSender
+
+
+class FailingSlackSender(InMemorySlackSender):
+    """Slack sender that always fails after retries."""
+
+    def send(self, alert):
+        raise IntegrationError(
+            message="Slack delivery failed after 3 retries",
+            context={"service": "slack"}
+        )
+
+
+class TestAlertGenerator:
+    """Test alert generation and dispatch."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fixed clock shared by the generator and mock senders."""
+        return FixedClock(datetime(2025, 11, 2))
+
+    @pytest.fixture
+    def violation(self):
+        """Create a sample violation."""
+        return Violation(
+            violation_id="V-001",
+            app_id="APP-001",
+            rule_id="threshold_orphan_accounts",
+            severity=Severity.HIGH,
+            kpi_values={"orphan_accounts": 6.0},
+            threshold_breached={"high": 5.0},
+            evidence={"kpi_value": "6.0"},
+            detected_at=datetime(2025, 11, 2, 9, 0, 0)
+        )
+
+    def test_generate_and_send_dispatches_both_channels(self, violation, clock):
+        """Test alert is persisted and sent via Slack and Email."""
+        storage = InMemoryStorage()
+        slack = InMemorySlackSender("xoxb-test", clock)
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(storage, slack, email, clock)
+
+        alert = gen.generate_and_send(violation)
+
+        assert storage.alerts == [alert]
+        assert slack.sent_alerts == [alert]
+        assert email.sent_alerts == [alert]
+        assert gen.delivery_failures == 0
+
+    def test_slack_failure_does_not_block_email(self, violation, clock):
+        """Test a failing channel is counted and the other still delivers."""
+        storage = InMemoryStorage()
+        slack = FailingSlackSender("xoxb-test", clock)
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(storage, slack, email, clock)
+
+        alert = gen.generate_and_send(violation)
+
+        assert email.sent_alerts == [alert]
+        assert gen.delivery_failures == 1
+
+    def test_safe_send_returns_failed_delivery_result(self, violation, clock):
+        """Test _safe_send converts exceptions into a DeliveryResult."""
+        gen = AlertGenerator(
+            InMemoryStorage(),
+            FailingSlackSender("xoxb-test", clock),
+            InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock),
+            clock
+        )
+        alert = gen.generate_and_send(violation)
+
+        result = gen._safe_send(gen.slack, alert)
+
+        assert result.success is False
+        assert "INTEGRATION_ERROR" in result.error
+        assert result.retries == 0
+
+    def test_generate_batch_persists_once_and_dispatches(self, violation, clock):
+        """Test batch generation persists all alerts in one call."""
+        storage = InMemoryStorage()
+        calls = []
+        storage.persist_alert = lambda alert: calls.append(alert)
+        slack = InMemorySlackSender("xoxb-test", clock)
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(storage, slack, email, clock)
+        second = violation.model_copy(update={"violation_id": "V-002"})
+
+        alerts = gen.generate_batch([violation, second])
+
+        assert calls == []
+        assert storage.alerts == alerts
+        assert [a.violation_ids for a in alerts] == [["V-001"], ["V-002"]]
+        assert slack.sent_alerts == alerts
+        assert email.sent_alerts == alerts
+
+    def test_generate_batch_reuses_dispatch_threads(self, violation, clock):
+        """Test successive batches are dispatched by the same worker threads."""
+        threads = set()
+
+        class RecordingSlackSender(InMemorySlackSender):
+            def send(self, alert):
+                threads.add(threading.current_thread())
+                return super().send(alert)
+
+        slack = RecordingSlackSender("xoxb-test", clock)
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(InMemoryStorage(), slack, email, clock)
+
+        for i in range(3):
+            gen.generate_batch([violation.model_copy(update={"violation_id": f"V-{i}"})])
+        gen.close()
+
+        assert len(slack.sent_alerts) == 3
+        assert len(threads) <= 2
+
+    def test_generate_batch_channel_failure_does_not_block_other(self, violation, clock):
+        """Test a failing channel is counted per alert while the other delivers."""
+        email = InMemoryEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(
+            InMemoryStorage(),
+            FailingSlackSender("xoxb-test", clock),
+            email,
+            clock
+        )
+        second = violation.model_copy(update={"violation_id": "V-002"})
+
+        alerts = gen.generate_batch([violation, second])
+
+        assert email.sent_alerts == alerts
+        assert gen.delivery_failures == 2
+
+    def test_generate_batch_digests_routine_alerts(self, violation, clock):
+        """Test MEDIUM/LOW alerts share one digest while HIGH is emailed alone."""
+        digests = []
+
+        class DigestEmailSender(InMemoryEmailSender):
+            def send_digest(self, alerts):
+                digests.append(list(alerts))
+                return super().send_digest(alerts)
+
+        slack = InMemorySlackSender("xoxb-test", clock)
+        email = DigestEmailSender("smtp.test.com", 587, "test@test.com", "test", clock)
+        gen = AlertGenerator(InMemoryStorage(), slack, email, clock)
+        medium = violation.model_copy(update={"violation_id": "V-002", "severity": Severity.MEDIUM})
+        low = violation.model_copy(update={"violation_id": "V-003", "severity": Severity.LOW})
+
+        high_alert, medium_alert, low_alert = gen.generate_batch([violation, medium, low])
+
+        assert slack.sent_alerts == [high_alert, medium_alert, low_alert]
+        assert digests == [[medium_alert, low_alert]]
+        assert email.sent_alerts == [high_alert, medium_alert, low_alert]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Unit tests for configuration loading.
+"""
+
+import os
+import pytest
+
+from src.modules.config.loader import ConfigLoader, SystemConfig
+from src.interfaces.errors import ConfigurationError
+
+
+class TestConfigLoader:
+    """Test YAML loading and caching."""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        """Write minimal config files."""
+        (tmp_path / "thresholds.yaml").write_text(
+            "alert_thresholds:\n  orphan_accounts:\n    high: 5\n"
+        )
+        (tmp_path / "notifications.yaml").write_text("slack_enabled: false\n")
+        return tmp_path
+
+    def test_load_yaml_returns_independent_copies(self, config_dir):
+        """Test cached YAML cannot be mutated through a returned dict."""
+        loader = ConfigLoader(config_dir=str(config_dir))
+
+        first = loader._load_yaml("thresholds.yaml")
+        first["alert_thresholds"]["orphan_accounts"]["high"] = 99
+
+        second = loader._load_yaml("thresholds.yaml")
+        assert second["alert_thresholds"]["orphan_accounts"]["high"] == 5
+
+    def test_load_yaml_picks_up_file_changes(self, config_dir):
+        """Test edited files are re-parsed."""
+        loader = ConfigLoader(config_dir=str(config_dir))
+        path = config_dir / "thresholds.yaml"
+        assert loader._load_yaml("thresholds.yaml")["alert_thresholds"]["orphan_accounts"]["high"] == 5
+
+        path.write_text("alert_thresholds:\n  orphan_accounts:\n    high: 10\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert loader._load_yaml("thresholds.yaml")["alert_thresholds"]["orphan_accounts"]["high"] == 10
+
+    def test_load_yaml_missing_file(self, tmp_path):
+        """Test missing file raises ConfigurationError."""
+        loader = ConfigLoader(config_dir=str(tmp_path))
+
+        with pytest.raises(ConfigurationError):
+            loader._load_yaml("thresholds.yaml")
+
+    def test_load_builds_system_config(self, config_dir, monkeypatch):
+        """Test load combines YAML sections with environment overrides."""
+        monkeypatch.setenv("OPENAI_MODEL", "gpt-4")
+        monkeypatch.setenv("STORAGE_TYPE", "postgres")
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+
+        config = ConfigLoader(config_dir=str(config_dir)).load()
+
+        assert config.thresholds.alert_thresholds["orphan_accounts"]["high"] == 5
+        assert config.notifications.slack_enabled is False
+        assert config.ai_settings.model == "gpt-4"
+        assert config.ai_settings.max_tokens["gpt-4-turbo"] == 128000
+        assert config.storage_type == "postgres"
+        assert config.log_level == "INFO"
+        assert SystemConfig.model_validate_json(config.model_dump_json()) == config
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
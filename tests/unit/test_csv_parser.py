@@ -0,0 +1,150 @@
+"""
+Unit tests for CSV ingestion.
+"""
+
+import io
+import pytest
+import pandas as pd
+from datetime import datetime
+
+from src.modules.ingestion.parser import CSVParser
+from src.interfaces.errors import ProcessingError
+from src.adapters.clock import FixedClock
+
+
+class TestCSVParser:
+    """Test CSV parsing and load detection."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create parser with fixed clock."""
+        return CSVParser(clock=FixedClock(datetime(2025, 11, 2, 9, 0, 0)))
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        """Write a small multi-app CSV."""
+        path = tmp_path / "uam.csv"
+        pd.DataFrame({
+            'app_id': ['APP-001', 'APP-001', 'APP-002', 'APP-003', 'APP-002'],
+            'user_id': ['U001', 'U002', 'U003', 'U004', 'U005'],
+            'failed_attempts': [0, 3, 1, 7, 2]
+        }).to_csv(path, index=False)
+        return path
+
+    def test_parse_streaming_yields_chunks(self, parser, csv_path):
+        """Test streaming parse covers every row in bounded chunks."""
+        chunks = list(parser.parse_streaming(str(csv_path), chunksize=2))
+
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        combined = pd.concat(chunks, ignore_index=True)
+        full, _ = parser.parse(str(csv_path))
+        pd.testing.assert_frame_equal(combined, full)
+
+    def test_parse_streaming_missing_file(self, parser, tmp_path):
+        """Test streaming parse raises ProcessingError for missing file."""
+        with pytest.raises(ProcessingError):
+            list(parser.parse_streaming(str(tmp_path / "missing.csv")))
+
+    def test_parse_normalizes_date_columns(self, parser, tmp_path):
+        """Test known date columns are converted once at ingestion."""
+        path = tmp_path / "dates.csv"
+        pd.DataFrame({
+            'app_id': ['APP-001', 'APP-001'],
+            'last_login_date': ['2025-10-30', 'not-a-date'],
+            'exit_date': [None, '2025-10-01']
+        }).to_csv(path, index=False)
+
+        df, _ = parser.parse(str(path))
+
+        assert pd.api.types.is_datetime64_any_dtype(df['last_login_date'])
+        assert pd.isna(df['last_login_date'][1])
+        assert df['exit_date'][1] == pd.Timestamp('2025-10-01')
+
+    def test_parse_keeps_identifiers_as_strings(self, parser, tmp_path):
+        """Test numeric-looking IDs are not inferred as integers."""
+        path = tmp_path / "ids.csv"
+        path.write_text("app_id,user_id,manager_id,failed_attempts\n001,007,,2\n")
+
+        df, _ = parser.parse(str(path))
+
+        assert df['app_id'][0] == '001'
+        assert df['user_id'][0] == '007'
+        assert pd.isna(df['manager_id'][0])
+        assert df['failed_attempts'][0] == 2
+
+    def test_parse_stream_from_memory(self, parser):
+        """Test file-like sources parse like files and stay open."""
+        source = io.StringIO("app_id,user_id,status\nAPP-001,007,active\nAPP-002,008,inactive\n")
+
+        df, is_full = parser.parse_stream(source)
+
+        assert df['user_id'].tolist() == ['007', '008']
+        assert isinstance(df['status'].dtype, pd.CategoricalDtype)
+        assert is_full is False
+        assert not source.closed
+
+    def test_parse_stream_invalid_source(self, parser):
+        """Test unreadable sources raise ProcessingError."""
+        with pytest.raises(ProcessingError):
+            parser.parse_stream(io.StringIO(""))
+
+    def test_parse_applies_explicit_dtypes(self, parser, tmp_path):
+        """Test label/flag columns are typed by read_csv and ISO datetimes parse."""
+        path = tmp_path / "typed.csv"
+        path.write_text(
+            "app_id,status,is_privileged,last_login_date\n"
+            "APP-001,active,True,2025-10-30\n"
+            "APP-001,inactive,,2025-10-30T08:15:00\n"
+        )
+
+        df, _ = parser.parse(str(path))
+
+        assert isinstance(df['status'].dtype, pd.CategoricalDtype)
+        assert df['is_privileged'].dtype == "boolean"
+        assert pd.isna(df['is_privileged'][1])
+        assert df['last_login_date'][1] == pd.Timestamp('2025-10-30 08:15:00')
+
+    def test_parse_maps_flag_spellings(self, parser):
+        """Test accepted flag spellings map to booleans and unknown ones to NA."""
+        csv = "is_privileged\n" + "\n".join(
+            ["True", "yes", "Y", " 1", "t", "FALSE", "no", "n", "0", "F", "maybe", ""]
+        ) + "\n"
+
+        df, _ = parser.parse_stream(io.StringIO(csv))
+
+        flags = df['is_privileged']
+        assert flags.dtype == "boolean"
+        assert flags[:10].tolist() == [True] * 5 + [False] * 5
+        assert flags[10:].isna().all()
+
+    def test_parse_dataframe_matches_csv_parse(self, parser, tmp_path):
+        """Test in-memory parsing normalizes like parse() and leaves input intact."""
+        source = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-002'],
+            'user_id': ['U001', 'U002'],
+            'is_privileged': [True, False],
+            'exit_date': [None, '2025-10-01']
+        })
+        path = tmp_path / "frame.csv"
+        source.to_csv(path, index=False)
+
+        df, is_full = parser.parse_dataframe(source)
+        expected, expected_full = parser.parse(str(path))
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert is_full is expected_full is False
+        assert source['exit_date'].dtype == object
+        assert source['is_privileged'].dtype == bool
+
+    def test_detect_full_load_across_scan_blocks(self, parser):
+        """Test distinct apps are counted across scan blocks."""
+        parser.FULL_LOAD_SCAN_BLOCK = 10
+        apps = [f"APP-{i:03d}" for i in range(parser.FULL_LOAD_APP_THRESHOLD + 1)]
+
+        assert parser._detect_full_load(pd.DataFrame({'app_id': apps * 2})) is True
+        assert parser._detect_full_load(pd.DataFrame({'app_id': apps[:-1] * 2})) is False
+        assert parser._detect_full_load(pd.DataFrame({'user_id': ['U1']})) is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -312,6 +312,15 @@ class TestDTOContracts:
             assert error_dict["error_code"] == error.error_code
             assert error_dict["message"] == error.message
 
+    def test_error_timestamp_is_raise_time(self):
+        """Test errors are stamped when created, not when first serialized."""
+        before = datetime.now()
+        error = ProcessingError("KPI calculation failed", {"kpi": "orphan_accounts"})
+        assert before <= error.timestamp <= datetime.now()
+
+        error.timestamp = datetime(2025, 11, 2, 9, 0, 0)
+        assert error.to_dict()["timestamp"] == "2025-11-02T09:00:00"
+
     def test_nested_dto_serialization(self):
         """Test serialization of nested DTOs."""
         # Create complex nested structure
@@ -89,6 +89,54 @@ class TestEnhancedAuditLogger:
         assert event['resource_type'] == 'KPI'
         assert event['action'] == 'READ'
 
+    def test_log_data_access_batch(self, audit_logger):
+        """Test batched data access events are all written to the audit log."""
+        audit_logger.log_data_access_batch([
+            ("KPI_CALCULATION", "APP-1_OrphanAccountsCalculator", "boom"),
+            ("POLICY_EVALUATION", "data/file.csv", "bad threshold"),
+        ])
+        
+        audit_trail = audit_logger.get_audit_trail()
+        data_access_events = [e for e in audit_trail if e.get('event_type') == 'DATA_ACCESS']
+        
+        assert [e['resource_type'] for e in data_access_events] == [
+            'KPI_CALCULATION', 'POLICY_EVALUATION'
+        ]
+        assert all(e['action'] == 'ERROR' for e in data_access_events)
+        assert data_access_events[1]['reason'] == 'bad threshold'
+        
+        # Regular logging resumes through the file handler afterwards
+        audit_logger.log_data_access(
+            user_id="user123", resource_type="KPI", resource_id="APP-123", action="READ"
+        )
+        assert len([
+            e for e in audit_logger.get_audit_trail() if e.get('event_type') == 'DATA_ACCESS'
+        ]) == 3
+
+    def test_background_writes(self, audit_logger):
+        """Test queued records reach the audit log once writes are stopped."""
+        audit_logger.start_background_writes()
+        audit_logger.start_background_writes()  # idempotent
+        
+        audit_logger.log_data_access(
+            user_id="user123", resource_type="KPI", resource_id="APP-123", action="READ"
+        )
+        audit_logger.log_data_access_batch([("KPI_CALCULATION", "APP-1", "boom")])
+        audit_logger.stop_background_writes()
+        
+        data_access_events = [
+            e for e in audit_logger.get_audit_trail() if e.get('event_type') == 'DATA_ACCESS'
+        ]
+        assert [e['resource_type'] for e in data_access_events] == ['KPI', 'KPI_CALCULATION']
+        
+        # Direct writes resume after stopping
+        audit_logger.log_data_access(
+            user_id="user123", resource_type="KPI", resource_id="APP-456", action="READ"
+        )
+        assert len([
+            e for e in audit_logger.get_audit_trail() if e.get('event_type') == 'DATA_ACCESS'
+        ]) == 3
+
     def test_log_configuration_change(self, audit_logger):
         """Test configuration change logging."""
         audit_logger.log_configuration_change(
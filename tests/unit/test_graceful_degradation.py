@@ -171,4 +171,20 @@ class TestGracefulDegradation:
         
         # Verify error context is preserved
         assert exc_info.value.context["app_id"] == "APP-012"
-        assert exc_info.value.context["kpi"] == "orphan_accounts"
\ No newline at end of file
+        assert exc_info.value.context["kpi"] == "orphan_accounts"
+
+    def test_json_response_parsed_in_single_pass(self):
+        """Test risk score, confidence and explanation come from JSON response."""
+        mock_client = Mock()
+        mock_client.analyze.return_value = (
+            '{"risk_score": 42, "confidence": 90, "explanation": "Spike in orphans"}'
+        )
+
+        clock = FixedClock(datetime(2025, 1, 1))
+        analyzer = RiskAnalyzer(mock_client, clock)
+
+        result = analyzer.analyze("APP-013", "orphan_accounts", 10.0)
+
+        assert result.risk_score == 42.0
+        assert result.confidence == 90.0
+        assert result.explanation == "Spike in orphans"
@@ -0,0 +1,91 @@
+"""
+Unit tests for JSONL storage adapter.
+"""
+
+import pytest
+from datetime import datetime
+
+from src.adapters.storage.jsonl import JsonlStorage
+from src.interfaces.dto import Violation, Severity
+
+
+class TestJsonlStorage:
+    """Test JSONL persistence."""
+
+    def _violation(self, violation_id: str, detected_at=datetime(2025, 11, 2, 9, 0, 0)) -> Violation:
+        return Violation(
+            violation_id=violation_id,
+            app_id="APP-001",
+            rule_id="threshold_orphan_accounts",
+            severity=Severity.HIGH,
+            kpi_values={"orphan_accounts": 6.0},
+            threshold_breached={"high": 5.0},
+            evidence={"kpi_value": "6.0"},
+            detected_at=detected_at
+        )
+
+    def test_persist_violations_writes_batch(self, tmp_path):
+        """Test batch persist appends one line per record."""
+        storage = JsonlStorage(str(tmp_path))
+
+        storage.persist_violations([self._violation("V-001"), self._violation("V-002")])
+        storage.persist_violations([])
+
+        found = storage.query_violations("APP-001", "NEW")
+        assert [v.violation_id for v in found] == ["V-001", "V-002"]
+
+    def test_load_violations_from_offset(self, tmp_path):
+        """Test loads skip records already read, whatever their timestamps."""
+        storage = JsonlStorage(str(tmp_path))
+        storage.persist_violations([
+            self._violation("V-001", datetime(2025, 11, 1, 9, 0, 0)),
+            self._violation("V-002", datetime(2025, 11, 2, 9, 0, 0)),
+        ])
+        assert [v.violation_id for v in storage.load_violations()] == ["V-001", "V-002"]
+
+        # Persisted later but stamped earlier than anything already read
+        storage.persist_violations([self._violation("V-003", datetime(2025, 10, 1, 9, 0, 0))])
+
+        newer = storage.load_violations(start=2)
+        assert [v.violation_id for v in newer] == ["V-003"]
+        assert storage.load_violations(start=3) == []
+        assert storage.load_alerts() == []
+
+    def test_load_stops_at_partial_line(self, tmp_path):
+        """Test a line still being appended is not read or counted."""
+        storage = JsonlStorage(str(tmp_path))
+        storage.persist_violations([self._violation("V-001")])
+        with open(storage.violations_file, "a") as f:
+            f.write('{"violation_id": "V-0')
+
+        assert [v.violation_id for v in storage.load_violations()] == ["V-001"]
+
+    def test_identity_is_per_directory(self, tmp_path):
+        """Test identity is stable for a directory and differs across them."""
+        first = JsonlStorage(str(tmp_path / "a"))
+
+        assert first.identity() == JsonlStorage(str(tmp_path / "a")).identity()
+        assert first.identity() != JsonlStorage(str(tmp_path / "b")).identity()
+
+    def test_extents_track_rotation_and_truncation(self, tmp_path):
+        """Test extents grow on append and change when a file is rewritten."""
+        storage = JsonlStorage(str(tmp_path))
+        assert storage.extents()["violations"] == (0, 0)
+
+        storage.persist_violations([self._violation("V-001"), self._violation("V-002")])
+        inode, size = storage.extents()["violations"]
+        assert size == storage.violations_file.stat().st_size > 0
+
+        # Truncated in place: same file, smaller size
+        storage.violations_file.write_text("")
+        assert storage.extents()["violations"] == (inode, 0)
+
+        # Rotated: a new file replaces the old one
+        rotated = tmp_path / "violations.jsonl.1"
+        storage.violations_file.rename(rotated)
+        storage.persist_violations([self._violation("V-003")])
+        assert storage.extents()["violations"][0] != inode
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -7,14 +7,25 @@ import pandas as pd
 from datetime import datetime
 
 from src.modules.kpi.calculators import (
+    OrphanAccountsCalculator,
+    PrivilegedAccountsCalculator,
+    FailedAccessAttemptsCalculator,
+    CountKPIAggregator,
+    RowKPIAggregator,
+    GroupKPIAggregator,
+    KPIAggregator,
+    KPICalculator,
     AccessProvisioningTimeCalculator,
     AccessReviewStatusCalculator,
     PolicyViolationsCalculator,
     ExcessivePermissionsCalculator,
-    DormantAccountsCalculator
+    DormantAccountsCalculator,
+    split_by_app,
+    compute_kpis_batch
 )
 from src.adapters.storage.in_memory import InMemoryStorage
 from src.adapters.clock import FixedClock
+from src.interfaces.errors import ProcessingError
 
 
 class TestNewKPICalculators:
@@ -210,6 +221,248 @@ class TestNewKPICalculators:
         assert stored_kpis[0].app_id == "APP-001"
         assert stored_kpis[0].value == 2.0
 
+    def test_compute_app_on_presplit_groups(self, test_setup):
+        """Test per-app slices from split_by_app match filtered compute."""
+        storage, clock, fixed_time = test_setup
+        calc = DormantAccountsCalculator(storage, clock)
+
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-002', 'APP-001'],
+            'status': ['active', 'active', 'active'],
+            'last_login_date': ['2025-01-01', '2025-10-30', None],
+            'account_created_date': ['2024-01-01', '2024-01-01', '2025-01-01']
+        })
+
+        groups = split_by_app(data)
+
+        assert list(groups) == ['APP-001', 'APP-002']
+        for app_id, app_data in groups.items():
+            assert calc.compute_app(app_data, app_id).value == calc.compute(data, app_id).value
+        assert data['last_login_date'].tolist() == ['2025-01-01', '2025-10-30', None]
+
+    def test_split_by_app_skips_unused_categories(self):
+        """Test a categorical app_id only yields apps present in the frame."""
+        data = pd.DataFrame({
+            'app_id': pd.Categorical(['APP-002', 'APP-001'], categories=['APP-001', 'APP-002', 'APP-003']),
+            'status': ['active', 'active']
+        })
+
+        groups = split_by_app(data)
+
+        assert list(groups) == ['APP-002', 'APP-001']
+        assert all(len(app_data) == 1 for app_data in groups.values())
+
+    def test_compute_from_group_reads_app_id(self, test_setup):
+        """Test groupby partitions are computed and persisted under their app_id."""
+        storage, clock, fixed_time = test_setup
+        calc = DormantAccountsCalculator(storage, clock)
+
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-002', 'APP-001'],
+            'status': ['active', 'active', 'active'],
+            'last_login_date': ['2025-01-01', '2025-10-30', None],
+            'account_created_date': ['2024-01-01', '2024-01-01', '2025-01-01']
+        })
+
+        for app_id, group in data.groupby('app_id', sort=False):
+            kpi = calc.compute_from_group(group)
+            assert kpi.app_id == app_id
+            assert kpi.value == calc.measure(group, app_id).value
+        assert [k.app_id for k in storage.kpis] == ['APP-001', 'APP-002']
+
+        with pytest.raises(ProcessingError):
+            calc.compute_from_group(data.iloc[0:0])
+
+    def test_compute_kpis_batch_persists_once(self, test_setup):
+        """Test batch driver measures all apps and persists in one call."""
+        storage, clock, fixed_time = test_setup
+        batches = []
+        storage.persist_kpi = lambda kpi: pytest.fail("per-record persist")
+        storage.persist_kpis = lambda kpis: batches.append(list(kpis))
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-002'],
+            'access_request_date': ['2025-10-01', '2025-10-10'],
+            'access_granted_date': ['2025-10-03', '2025-10-15']
+        })
+        calculators = [
+            AccessProvisioningTimeCalculator(storage, clock),
+            DormantAccountsCalculator(storage, clock)
+        ]
+
+        kpis = compute_kpis_batch(calculators, split_by_app(data), storage)
+
+        assert batches == [kpis]
+        assert [(k.app_id, k.kpi_name) for k in kpis] == [
+            ('APP-001', 'access_provisioning_time'), ('APP-001', 'dormant_accounts'),
+            ('APP-002', 'access_provisioning_time'), ('APP-002', 'dormant_accounts')
+        ]
+        assert kpis[2].value == 5.0
+
+    def test_count_aggregator_matches_per_app_calculators(self, test_setup):
+        """Test vectorized count KPIs agree with the per-app calculators."""
+        storage, clock, fixed_time = test_setup
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-001', 'APP-002', 'APP-002', 'APP-002'],
+            'user_id': ['U1', 'U2', 'U1', 'U3', 'U4'],
+            'manager_id': [None, 'U1', 'U2', 'U1', 'U9'],
+            'is_privileged': [True, False, True, True, False],
+            'failed_attempts': [0, 3, 1, 7, 2]
+        })
+
+        kpis = CountKPIAggregator(storage, clock).compute_all(data)
+
+        got = {(k.app_id, k.kpi_name): k.value for k in kpis}
+        for calc_cls in (OrphanAccountsCalculator, PrivilegedAccountsCalculator,
+                         FailedAccessAttemptsCalculator):
+            calc = calc_cls(InMemoryStorage(), clock)
+            for app_id in ('APP-001', 'APP-002'):
+                assert got[(app_id, calc.kpi_name)] == calc.compute(data, app_id).value
+        assert got[('APP-002', 'orphan_accounts')] == 2.0
+        assert len(storage.kpis) == 6
+
+    def test_excessive_permissions_with_categorical_labels(self, test_setup):
+        """Test categorical role/environment columns give the same count."""
+        storage, clock, fixed_time = test_setup
+        calc = ExcessivePermissionsCalculator(storage, clock)
+        data = pd.DataFrame({
+            'app_id': ['APP-001'] * 4,
+            'user_id': ['U1', 'U1', 'U2', 'U3'],
+            'role': ['ADMIN', 'DBA', 'USER', None],
+            'is_privileged': [True, True, False, True],
+            'environment': ['DEV', 'PROD', 'PROD', None]
+        })
+        categorical = data.astype({'role': 'category', 'environment': 'category'})
+
+        expected = calc.compute(data, 'APP-001').value
+
+        assert expected == 3.0
+        assert calc.compute(categorical, 'APP-001').value == expected
+
+    def test_policy_violations_with_nullable_flags(self, test_setup):
+        """Test missing privilege flags and empty exit dates are not counted."""
+        storage, clock, fixed_time = test_setup
+        calc = PolicyViolationsCalculator(storage, clock)
+        data = pd.DataFrame({
+            'app_id': ['APP-001'] * 4,
+            'is_privileged': pd.array([True, None, False, True], dtype="boolean"),
+            'last_review_date': ['2025-01-01', '2025-01-01', '2025-01-01', '2025-10-30'],
+            'status': ['active', 'active', 'active', 'inactive'],
+            'exit_date': ['2025-10-01', '', None, '2025-10-01']
+        })
+
+        result = calc.compute(data, 'APP-001')
+
+        # One stale privileged review plus one active account with an exit date
+        assert result.value == 2.0
+
+    def test_count_aggregator_streaming_across_chunks(self, test_setup):
+        """Test running totals match a single pass when apps span chunks."""
+        storage, clock, fixed_time = test_setup
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-002', 'APP-001', 'APP-002'],
+            'user_id': ['U2', 'U3', 'U1', 'U4'],
+            'manager_id': ['U1', 'U9', None, 'U3'],
+            'failed_attempts': [1, 2, 3, 4]
+        })
+        chunks = [data.iloc[:2], data.iloc[2:]]
+
+        aggregator = CountKPIAggregator(storage, clock)
+        streamed = {(k.app_id, k.kpi_name): k.value for k in aggregator.compute_streaming(chunks)}
+        single = {(k.app_id, k.kpi_name): k.value for k in aggregator.compute_all(data)}
+
+        assert streamed == single
+        # U1 manages U2 but only appears in the second chunk
+        assert streamed[('APP-001', 'orphan_accounts')] == 0.0
+        assert streamed[('APP-002', 'failed_access_attempts')] == 6.0
+
+    def test_row_aggregator_matches_per_app_calculators(self, test_setup):
+        """Test whole-frame row-flag KPIs agree with the per-app calculators."""
+        storage, clock, fixed_time = test_setup
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-001', 'APP-002', 'APP-002', 'APP-002'],
+            'status': ['active', 'inactive', 'active', 'active', None],
+            'is_privileged': [True, True, False, True, None],
+            'failed_attempts': [12, 0, 3, 15, 1],
+            'last_review_date': ['2025-05-01', '2025-10-20', None, '2025-09-01', '2025-01-01'],
+            'last_login_date': ['2025-10-30', None, '2025-06-01', None, '2025-01-01'],
+            'account_created_date': ['2025-01-01', '2025-10-01', '2025-01-01', '2025-10-31', '2024-01-01'],
+            'exit_date': [None, '2025-09-01', '2025-10-01', None, '2025-08-01']
+        })
+
+        kpis = RowKPIAggregator(storage, clock).compute_all(data)
+
+        got = {(k.app_id, k.kpi_name): k.value for k in kpis}
+        for calc_cls in (AccessReviewStatusCalculator, PolicyViolationsCalculator,
+                         DormantAccountsCalculator):
+            calc = calc_cls(InMemoryStorage(), clock)
+            for app_id in ('APP-001', 'APP-002'):
+                assert got[(app_id, calc.kpi_name)] == calc.compute(data, app_id).value
+        assert len(storage.kpis) == 6
+
+    def test_aggregators_skip_unused_app_categories(self, test_setup):
+        """Test categorical app_ids yield records only for apps in the frame."""
+        storage, clock, fixed_time = test_setup
+        data = pd.DataFrame({
+            'app_id': pd.Categorical(['A', 'A', 'B'], categories=['A', 'B', 'C']),
+            'user_id': ['U1', 'U2', 'U3'],
+            'manager_id': ['U1', 'U9', None],
+            'role': ['ADMIN', 'USER', 'DBA'],
+            'is_privileged': [True, False, True],
+            'failed_attempts': [0, 12, 1],
+            'status': ['active', 'active', 'active'],
+            'last_login_date': ['2025-10-30', '2025-01-01', '2025-10-30']
+        })
+
+        for aggregator_cls in (CountKPIAggregator, RowKPIAggregator, GroupKPIAggregator):
+            kpis = aggregator_cls(storage, clock).compute_all(data)
+            assert sorted({k.app_id for k in kpis}) == ['A', 'B'], aggregator_cls.__name__
+
+    def test_aggregators_cover_every_calculator(self):
+        """Test the whole-frame aggregators together produce every KPI."""
+        calculator_kpis = {
+            calc_cls.kpi_name for calc_cls in (
+                OrphanAccountsCalculator, PrivilegedAccountsCalculator,
+                FailedAccessAttemptsCalculator, AccessProvisioningTimeCalculator,
+                AccessReviewStatusCalculator, PolicyViolationsCalculator,
+                ExcessivePermissionsCalculator, DormantAccountsCalculator
+            )
+        }
+        aggregated = (
+            CountKPIAggregator.kpi_names
+            + RowKPIAggregator.kpi_names
+            + GroupKPIAggregator.kpi_names
+        )
+
+        assert sorted(aggregated) == sorted(calculator_kpis)
+        # Aggregators are not per-app calculators and cannot pass for one
+        for aggregator_cls in (CountKPIAggregator, RowKPIAggregator, GroupKPIAggregator):
+            assert issubclass(aggregator_cls, KPIAggregator)
+            assert not issubclass(aggregator_cls, KPICalculator)
+
+    def test_group_aggregator_matches_per_app_calculators(self, test_setup):
+        """Test factorized per-app statistics agree with the per-app calculators."""
+        storage, clock, fixed_time = test_setup
+        data = pd.DataFrame({
+            'app_id': ['APP-001', 'APP-001', 'APP-001', 'APP-002', 'APP-002', None],
+            'user_id': ['U1', 'U1', 'U2', 'U3', 'U3', 'U1'],
+            'role': ['ADMIN', 'DBA', 'USER', 'ROOT', 'USER', 'ADMIN'],
+            'environment': ['DEV', 'PROD', 'PROD', 'QA', None, 'DEV'],
+            'is_privileged': [True, True, False, True, None, True],
+            'justification': ['ok', '', None, 'ok', None, None],
+            'access_request_date': ['2025-10-01', '2025-10-05', None, '2025-10-10', '2025-10-10', '2025-10-01'],
+            'access_granted_date': ['2025-10-03', '2025-10-06', '2025-10-07', '2025-10-15', '2025-10-01', '2025-10-09']
+        })
+
+        kpis = GroupKPIAggregator(storage, clock).compute_all(data)
+
+        got = {(k.app_id, k.kpi_name): k.value for k in kpis}
+        for calc_cls in (AccessProvisioningTimeCalculator, ExcessivePermissionsCalculator):
+            calc = calc_cls(InMemoryStorage(), clock)
+            for app_id in ('APP-001', 'APP-002'):
+                assert got[(app_id, calc.kpi_name)] == calc.compute(data, app_id).value
+        assert got[('APP-001', 'access_provisioning_time')] == 1.5
+        assert len(storage.kpis) == 4
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Unit tests for PolicyRuleEngine.
+"""
+
+import pytest
+from datetime import datetime
+
+from uuid import UUID
+
+from src.modules.policy.rules import PolicyRuleEngine, _uuid4_batch
+from src.interfaces.dto import Severity
+from src.adapters.storage.in_memory import InMemoryStorage
+from src.adapters.clock import FixedClock
+
+
+class TestPolicyRuleEngine:
+    """Test threshold classification."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create engine with orphan thresholds."""
+        thresholds = {"orphan_accounts": {"medium": 2, "high": 5, "critical": 10}}
+        return PolicyRuleEngine(InMemoryStorage(), FixedClock(datetime(2025, 11, 2)), thresholds)
+
+    def test_evaluate_batch_classifies_boundaries(self, engine):
+        """Test values at each threshold map to that severity."""
+        rows = [("APP-%03d" % i, "orphan_accounts", v) for i, v in enumerate([1, 2, 5, 9.9, 10, float("nan")])]
+
+        violations = engine.evaluate_batch(rows)
+
+        assert [(v.app_id, v.severity) for v in violations] == [
+            ("APP-001", Severity.MEDIUM),
+            ("APP-002", Severity.HIGH),
+            ("APP-003", Severity.HIGH),
+            ("APP-004", Severity.CRITICAL),
+        ]
+        assert engine.storage.violations == violations
+
+    def test_unknown_kpi_and_inconsistent_thresholds(self):
+        """Test unset thresholds never fire and higher levels take precedence."""
+        engine = PolicyRuleEngine(
+            InMemoryStorage(),
+            FixedClock(datetime(2025, 11, 2)),
+            {"failed_access_attempts": {"medium": 50, "critical": 20}}
+        )
+
+        violations = engine.evaluate("APP-001", {"failed_access_attempts": 30, "unknown": 1000})
+
+        assert [v.severity for v in violations] == [Severity.CRITICAL]
+
+    def test_uuid4_batch_mints_valid_unique_ids(self):
+        """Test batched IDs are distinct RFC 4122 version 4 UUIDs."""
+        ids = _uuid4_batch(50)
+
+        assert len(set(ids)) == 50
+        for value in ids:
+            parsed = UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == "specified in RFC 4122"
+        assert _uuid4_batch(0) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
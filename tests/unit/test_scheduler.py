@@ -0,0 +1,205 @@
+"""
+Unit tests for the compliance scheduler.
+"""
+
+import json
+import os
+import time
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+from src.composition_root import ServiceContainer
+from tests.integration.mock_adapters import InMemorySlackSender, InMemoryEmailSender
+from src.orchestration.scheduler import ComplianceScheduler, encode_report, seconds_until
+
+
+class TestSecondsUntil:
+    """Test next-run delay computation."""
+
+    def test_later_today(self):
+        """Test a time later today is reached the same day."""
+        now = datetime(2025, 11, 2, 1, 30, 0)
+        assert seconds_until(2, 0, now) == 30 * 60
+
+    def test_passed_time_rolls_to_tomorrow(self):
+        """Test a time already passed (or exactly now) schedules tomorrow."""
+        now = datetime(2025, 11, 2, 2, 0, 0)
+        assert seconds_until(2, 0, now) == 24 * 3600
+        assert seconds_until(1, 0, now) == 23 * 3600
+
+
+class TestEncodeReport:
+    """Test report serialization."""
+
+    def test_round_trips_with_stringified_fallbacks(self):
+        """Test reports decode back with unknown types stringified."""
+        report = {
+            "summary": {"total_violations": 3, "high_risk_violations": 1},
+            "violations_by_app": {"APP-001": 2, "APP-002": 1},
+            "generated_at": datetime(2025, 11, 2, 6, 0, 0),
+            "source": object.__new__(type("Marker", (), {"__str__": lambda self: "marker"}))
+        }
+
+        decoded = json.loads(encode_report(report))
+
+        assert decoded["summary"] == report["summary"]
+        assert decoded["violations_by_app"] == report["violations_by_app"]
+        assert decoded["generated_at"].startswith("2025-11-02")
+        assert decoded["source"] == "marker"
+
+
+class TestInitialization:
+    """Test scheduler service wiring."""
+
+    def test_container_built_once_per_config_path(self, tmp_path, monkeypatch):
+        """Test schedulers sharing a config path share one container."""
+        config_path = str(Path(__file__).resolve().parents[2] / "config")
+        monkeypatch.chdir(tmp_path)
+
+        first = ComplianceScheduler(config_path)
+        first.initialize()
+        second = ComplianceScheduler(config_path)
+        second.initialize()
+
+        assert first.container is second.container
+        assert first.container.kpi_calculators() is first.container.kpi_calculators()
+        # Services built by warmup() are the ones later callers get
+        for future in first.container.warmup():
+            future.result()
+        assert first.container.alert_generator() is second.container.alert_generator()
+        assert first.container.policy_engine() is second.container.policy_engine()
+
+    def test_stopped_scheduler_does_not_hand_out_closed_container(self, tmp_path, monkeypatch):
+        """Test a container closed by run_scheduler is not reused."""
+        config_path = str(Path(__file__).resolve().parents[2] / "config")
+        monkeypatch.chdir(tmp_path)
+
+        async def no_jobs():
+            return None
+
+        first = ComplianceScheduler(config_path)
+        first.initialize()
+        closed = first.container
+        monkeypatch.setattr(first, "_run_scheduler", no_jobs)
+        first.run_scheduler()
+
+        second = ComplianceScheduler(config_path)
+        second.initialize()
+
+        assert second.container is not closed
+        assert second.container.alert_generator()._dispatch_pool.submit(int).result() == 0
+        second.container.close()
+
+
+class TestProcessFile:
+    """Test the per-file pipeline."""
+
+    @pytest.fixture
+    def scheduler(self, tmp_path, monkeypatch):
+        """Scheduler wired to the test container with in-memory senders."""
+        monkeypatch.chdir(tmp_path)
+        container = ServiceContainer.test()
+        container.slack = InMemorySlackSender("xoxb-test", container.clock)
+        container.email = InMemoryEmailSender(
+            "smtp.test.com", 587, "test", "test", container.clock
+        )
+        scheduler = ComplianceScheduler()
+        scheduler.container = container
+        scheduler.logger = container.audit_logger
+        scheduler._stages = scheduler._build_pipeline()
+        return scheduler
+
+    def test_pipeline_order_is_frozen(self, scheduler):
+        """Test stages run in dependency order."""
+        assert [stage.__name__ for stage in scheduler._stages] == [
+            "_stage_parse", "_stage_kpis", "_stage_evaluate", "_stage_notify"
+        ]
+
+    def test_processes_file(self, scheduler, tmp_path):
+        """Test a file runs through every stage."""
+        csv_path = tmp_path / "export.csv"
+        rows = ["app_id,user_id,role,is_privileged,exit_date,status"]
+        rows += [f"APP-001,U{i},ADMIN,True,2025-01-01,ACTIVE" for i in range(12)]
+        csv_path.write_text("\n".join(rows) + "\n")
+
+        counts = scheduler._process_file(csv_path)
+
+        assert "error" not in counts
+        assert counts["files_processed"] == 1
+        assert counts["total_records"] == 12
+        assert counts["kpis_computed"] > 0
+        assert counts["violations_found"] > 0
+
+    @pytest.mark.asyncio
+    async def test_workflow_archives_only_processed_files(self, scheduler, tmp_path):
+        """Test successful files are archived together and failures stay put."""
+        incoming = tmp_path / "data" / "incoming"
+        incoming.mkdir(parents=True)
+        (incoming / "good_a.csv").write_text("app_id,user_id\nAPP-001,U1\n")
+        (incoming / "good_b.csv").write_text("app_id,user_id\nAPP-002,U2\n")
+        (incoming / "bad.csv").write_text("")
+
+        results = await scheduler.process_compliance_workflow()
+
+        assert results["files_processed"] == 2
+        assert len(results["errors"]) == 1
+        assert [p.name for p in incoming.iterdir()] == ["bad.csv"]
+        archived = sorted(p.name for p in (tmp_path / "data" / "archive").iterdir())
+        assert [name.split("_", 2)[:2] for name in archived] == [["good", "a"], ["good", "b"]]
+        # One workflow timestamp is shared by every archived file
+        assert len({name.split("_", 2)[2] for name in archived}) == 1
+
+    def test_missing_file_reports_error(self, scheduler, tmp_path):
+        """Test a fatal stage failure is returned under "error"."""
+        counts = scheduler._process_file(tmp_path / "missing.csv")
+
+        assert counts["files_processed"] == 0
+        assert "missing.csv" in counts["error"]
+
+
+class TestScheduledJobs:
+    """Test scheduled job execution."""
+
+    @pytest.mark.asyncio
+    async def test_failing_job_does_not_raise(self):
+        """Test a job failure is reported instead of stopping the scheduler."""
+        async def failing_job():
+            raise RuntimeError("boom")
+
+        await ComplianceScheduler()._run_job(failing_job)
+
+    @pytest.mark.asyncio
+    async def test_check_for_new_files(self, tmp_path, monkeypatch):
+        """Test only recently modified CSV files trigger the workflow."""
+        monkeypatch.chdir(tmp_path)
+        scheduler = ComplianceScheduler()
+        scheduler.container = ServiceContainer.test()
+        runs = []
+
+        async def fake_workflow():
+            runs.append(True)
+
+        monkeypatch.setattr(scheduler, "process_compliance_workflow", fake_workflow)
+
+        # Missing directory is not an error
+        await scheduler.check_for_new_files()
+        assert runs == []
+
+        incoming = tmp_path / "data" / "incoming"
+        incoming.mkdir(parents=True)
+        stale = incoming / "old.csv"
+        stale.write_text("app_id\n")
+        two_hours_ago = time.time() - 7200
+        os.utime(stale, (two_hours_ago, two_hours_ago))
+        (incoming / "notes.txt").write_text("")
+        await scheduler.check_for_new_files()
+        assert runs == []
+
+        (incoming / "new.csv").write_text("app_id\n")
+        await scheduler.check_for_new_files()
+        assert runs == [True]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Unit tests for SlackAdapter connection handling.
+"""
+
+import http.client
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.message import Message
+
+from src.adapters.slack_adapter import SlackAdapter
+from src.interfaces.dto import Alert, Persona, Severity
+
+
+class FakeResponse:
+    """Minimal http.client response carrying a Slack API body."""
+
+    def __init__(self, payload):
+        self.status = 200
+        self.reason = "OK"
+        self.headers = Message()
+        self.headers["Content-Type"] = "application/json; charset=utf-8"
+        self._body = json.dumps(payload).encode("utf-8")
+
+    def read(self):
+        return self._body
+
+
+class FakeHTTPSConnection:
+    """Records requests instead of opening sockets."""
+
+    opened = []
+
+    def __init__(self, host, timeout=None, context=None):
+        self.host = host
+        self.requests = []
+        self.closed = False
+        self.drop_next = False
+        self.timeout_next = False
+        FakeHTTPSConnection.opened.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        if self.drop_next:
+            self.drop_next = False
+            raise http.client.RemoteDisconnected("idle connection closed")
+        self.requests.append((method, path, json.loads(body)))
+
+    def getresponse(self):
+        if self.timeout_next:
+            self.timeout_next = False
+            raise TimeoutError("timed out")
+        return FakeResponse({"ok": True, "channel": "C1", "ts": "1.0"})
+
+    def close(self):
+        self.closed = True
+
+
+class TestSlackAdapter:
+    """Test Slack delivery over a reused connection."""
+
+    @pytest.fixture(autouse=True)
+    def fake_connections(self, monkeypatch):
+        """Replace HTTPS connections with in-memory fakes."""
+        FakeHTTPSConnection.opened = []
+        monkeypatch.setattr(http.client, "HTTPSConnection", FakeHTTPSConnection)
+
+    @pytest.fixture
+    def alert(self):
+        """Create a sample alert."""
+        return Alert(
+            alert_id="A-001",
+            app_id="APP-001",
+            severity=Severity.HIGH,
+            risk_score=72.0,
+            violation_ids=["V-001"],
+            title="Orphan accounts exceeded",
+            description="6 orphan accounts",
+            recommendations=["Disable orphan accounts", "Review access", "Notify owner"],
+            created_at=datetime(2025, 11, 2, 9, 0, 0),
+            persona=Persona.COMPLIANCE_OFFICER
+        )
+
+    def test_sends_reuse_one_connection(self, alert):
+        """Test consecutive sends share a single HTTPS connection."""
+        slack = SlackAdapter(bot_token="xoxb-test")
+
+        assert slack.send(alert).success
+        assert slack.send(alert).success
+
+        assert len(FakeHTTPSConnection.opened) == 1
+        conn = FakeHTTPSConnection.opened[0]
+        assert conn.host == "slack.com"
+        assert [r[1] for r in conn.requests] == ["/api/chat.postMessage"] * 2
+        assert conn.requests[0][2]["channel"] == "#security-critical"
+
+    def test_sends_from_successive_threads_share_the_pool(self, alert):
+        """Test connections outlive the worker threads that used them."""
+        slack = SlackAdapter(bot_token="xoxb-test")
+
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                assert pool.submit(slack.send, alert).result().success
+
+        assert len(FakeHTTPSConnection.opened) == 1
+        assert len(FakeHTTPSConnection.opened[0].requests) == 3
+
+    def test_dropped_connection_is_retried(self, alert):
+        """Test a connection closed by the server is replaced transparently."""
+        slack = SlackAdapter(bot_token="xoxb-test")
+        slack.send(alert)
+        FakeHTTPSConnection.opened[0].drop_next = True
+
+        assert slack.send(alert).success
+        first, second = FakeHTTPSConnection.opened
+        assert first.closed
+        assert len(second.requests) == 1
+
+    def test_timed_out_connection_is_discarded(self, alert):
+        """Test a connection that raised is never reused."""
+        slack = SlackAdapter(bot_token="xoxb-test")
+        slack.send(alert)
+        FakeHTTPSConnection.opened[0].timeout_next = True
+
+        with pytest.raises(TimeoutError):
+            slack.send(alert)
+
+        assert slack.send(alert).success
+        first, second = FakeHTTPSConnection.opened
+        assert first.closed
+        assert len(second.requests) == 1
+
+    def test_close_releases_connections(self, alert):
+        """Test close() closes the held connection."""
+        slack = SlackAdapter(bot_token="xoxb-test")
+        slack.send(alert)
+
+        slack.close()
+
+        assert FakeHTTPSConnection.opened[0].closed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])